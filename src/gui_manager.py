@@ -36,6 +36,7 @@ from server_analysis_gui import (
     _baue_server_summary,
     _baue_serverziele,
     _integriere_manuelle_anmerkungen,
+    _serialisiere_zeile,
     persistiere_serveranalyse_zustand,
 )
 
@@ -1259,7 +1260,7 @@ class OnboardingController:
         discovery_eingabe = modulzustand_serveranalyse.get("letzte_discovery_eingabe", {})
 
         persistenzdaten = ServerAnalysePersistenzDaten(
-            serverlisten=[zeile.__dict__.copy() for zeile in self.server_zeilen],
+            serverlisten=[_serialisiere_zeile(zeile) for zeile in self.server_zeilen],
             rollen={zeile.servername: zeile.rollen() for zeile in self.server_zeilen},
             letzte_discovery_range=self.gui.modulzustand.get("letzte_discovery_range", "").strip(),
             letzter_discovery_modus=str(modulzustand_serveranalyse.get("letzter_discovery_modus", "range") or "range").strip(),
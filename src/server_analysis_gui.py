@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+import copy
+import io
+import json
 import queue
 import re
 import threading
 import time
 import tkinter as tk
-from tkinter import simpledialog, ttk
+from tkinter import ttk
 
 from systemmanager_sagehelper.analyzer import (
     analysiere_mehrere_server,
@@ -25,11 +33,11 @@ from systemmanager_sagehelper.gui_shell import GuiShell
 from systemmanager_sagehelper.installation_state import pruefe_installationszustand, verarbeite_installations_guard
 from systemmanager_sagehelper.gui_state import GUIStateStore
 from systemmanager_sagehelper.logging_setup import erstelle_lauf_id, konfiguriere_logger, setze_lauf_id
-from systemmanager_sagehelper.models import AnalyseErgebnis, DiscoveryErgebnis, ServerDetailkarte, ServerZiel
+from systemmanager_sagehelper.models import AnalyseErgebnis, DiscoveryErgebnis, KomponentenVersion, ServerDetailkarte, ServerZiel
 from systemmanager_sagehelper.config import STANDARD_PORTS
 from systemmanager_sagehelper.discovery_rollen import ableite_rollen_aus_discoveryindikatoren
-from systemmanager_sagehelper.report import render_markdown
-from systemmanager_sagehelper.viewmodel import baue_server_detailkarte, baue_server_detailkarten
+from systemmanager_sagehelper.report import iter_markdown_abschnitte
+from systemmanager_sagehelper.viewmodel import baue_server_detailkarte
 from systemmanager_sagehelper.targeting import normalisiere_servernamen, rollen_aus_bool_flags
 from systemmanager_sagehelper.texte import (
     BERICHT_MANAGEMENT_ZUSAMMENFASSUNG,
@@ -38,7 +46,7 @@ from systemmanager_sagehelper.texte import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerTabellenZeile:
     """Zeilenmodell für die GUI-Tabelle mit Deklaration eines Zielservers."""
 
@@ -59,12 +67,26 @@ class ServerTabellenZeile:
     erreichbar: bool = False
     rollenhinweise: tuple[str, ...] = ()
     manuelle_anmerkung: str = ""
+    # Normalisierter Name für Index- und Duplikatprüfungen; wird nicht persistiert.
+    name_norm: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_norm = normalisiere_servernamen(self.servername)
 
     def rollen(self) -> list[str]:
         """Leitet die Rollenliste aus den gesetzten Checkboxen ab."""
         return rollen_aus_bool_flags(sql=self.sql, app=self.app, ctx=self.ctx, dc=self.dc)
 
 
+# Persistierte Felder einer Tabellenzeile; einmalig ermittelt statt je Zeile über `asdict`.
+_ZEILEN_FELDER = tuple(feld.name for feld in fields(ServerTabellenZeile) if feld.init)
+
+
+def _serialisiere_zeile(zeile: ServerTabellenZeile) -> dict[str, object]:
+    """Wandelt eine Tabellenzeile flach in ein JSON-taugliches Dict (Format wie `asdict`)."""
+    return {name: getattr(zeile, name) for name in _ZEILEN_FELDER}
+
+
 _SPALTE_SERVERNAME = "servername"
 _SPALTE_SQL = "sql"
 _SPALTE_APP = "app"
@@ -74,9 +96,33 @@ _SPALTE_QUELLE = "quelle"
 _SPALTE_STATUS = "status"
 _SPALTEN = (_SPALTE_SERVERNAME, _SPALTE_SQL, _SPALTE_APP, _SPALTE_CTX, _SPALTE_DC, _SPALTE_QUELLE, _SPALTE_STATUS)
 _ROLLEN_SPALTEN = {_SPALTE_SQL: "sql", _SPALTE_APP: "app", _SPALTE_CTX: "ctx", _SPALTE_DC: "dc"}
+# Statische Spaltenkonfiguration der Serverliste: (Spalte, Überschrift, Breite, Ausrichtung).
+_SPALTEN_LAYOUT = (
+    (_SPALTE_SERVERNAME, "Servername", 220, "w"),
+    (_SPALTE_SQL, "SQL", 70, "center"),
+    (_SPALTE_APP, "APP", 70, "center"),
+    (_SPALTE_CTX, "CTX", 70, "center"),
+    (_SPALTE_DC, "DC", 70, "center"),
+    (_SPALTE_QUELLE, "Quelle", 130, "w"),
+    (_SPALTE_STATUS, "Status", 180, "w"),
+)
+# Treeview-Spalten-ID (`#N`) -> (Spaltenname, Rollenattribut), damit ein Klick mit einem Lookup aufgelöst wird.
+_SPALTEN_KLICK_ATTR = {
+    f"#{index}": (name, _ROLLEN_SPALTEN[name]) for index, name in enumerate(_SPALTEN, start=1) if name in _ROLLEN_SPALTEN
+}
 _CHECK_AN = "☑"
 _CHECK_AUS = "☐"
-_KRITISCHE_PORTS = {port.port for port in STANDARD_PORTS}
+# Indiziert über bool: False -> leere, True -> gesetzte Checkbox.
+_CHECKBOX = (_CHECK_AUS, _CHECK_AN)
+# Indiziert über bool: False -> "nicht erkannt", True -> "erkannt".
+_ERKANNT = ("nicht erkannt", "erkannt")
+_PORT_STATUS = ("blockiert/unerreichbar", "offen")
+# Lokale Zeit im ISO-Format ohne Sekundenbruchteile, entspricht `datetime.now().isoformat(timespec="seconds")`.
+_EXPORT_ZEITFORMAT = "%Y-%m-%dT%H:%M:%S"
+# Schreibpuffer für den Berichtsexport (1 MiB), damit viele kleine Abschnitte gebündelt auf die Platte gehen.
+_REPORT_PUFFERGROESSE = 1 << 20
+_JA_NEIN = ("nein", "ja")
+_KRITISCHE_PORTS = frozenset(port.port for port in STANDARD_PORTS)
 
 
 logger = konfiguriere_logger(__name__, dateiname="server_analysis_gui.log")
@@ -84,28 +130,39 @@ logger = konfiguriere_logger(__name__, dateiname="server_analysis_gui.log")
 _IPV4_BASIS_REGEX = re.compile(r"^(?:25[0-5]|2[0-4]\d|1?\d?\d)\.(?:25[0-5]|2[0-4]\d|1?\d?\d)\.(?:25[0-5]|2[0-4]\d|1?\d?\d)$")
 
 
-def _checkbox_wert(aktiv: bool) -> str:
-    """Formatiert boolesche Rollenwerte als visuelles Checkbox-Symbol."""
-    return _CHECK_AN if aktiv else _CHECK_AUS
+@lru_cache(maxsize=64)
+def _ist_gueltige_ipv4_basis(basis: str) -> bool:
+    """Prüft eine IPv4-Basis; wiederholte Validierungen derselben Eingabe überspringen den Regex."""
+    return _IPV4_BASIS_REGEX.fullmatch(basis) is not None
+
+
+def _tree_values(zeile: ServerTabellenZeile) -> tuple[str, ...]:
+    """Liefert die Zellwerte einer Serverzeile in Spaltenreihenfolge von `_SPALTEN`."""
+    an, aus = _CHECK_AN, _CHECK_AUS
+    return (
+        zeile.servername,
+        an if zeile.sql else aus,
+        an if zeile.app else aus,
+        an if zeile.ctx else aus,
+        an if zeile.dc else aus,
+        zeile.quelle,
+        zeile.status,
+    )
 
 
-def _baue_serverziele(zeilen: list[ServerTabellenZeile]) -> list[ServerZiel]:
+def _baue_serverziele(zeilen: Sequence[ServerTabellenZeile]) -> list[ServerZiel]:
     """Erzeugt Analyse-DTOs aus dem Zeilenmodell der GUI-Tabelle."""
-    ziele: list[ServerZiel] = []
-    for zeile in zeilen:
-        name = zeile.servername.strip()
-        if not name:
-            continue
-        ziele.append(
-            ServerZiel(
-                name=name,
-                rollen=zeile.rollen(),
-                rollenquelle=_rollenquelle_fuer_zeile(zeile),
-                auto_rollen=[rolle.strip() for rolle in zeile.auto_rolle.split(",") if rolle.strip()] if zeile.auto_rolle else [],
-                manuell_ueberschrieben=zeile.manuell_ueberschrieben,
-            )
+    return [
+        ServerZiel(
+            name=name,
+            rollen=zeile.rollen(),
+            rollenquelle=_rollenquelle_fuer_zeile(zeile),
+            auto_rollen=[rolle for roh in (zeile.auto_rolle or "").split(",") if (rolle := roh.strip())],
+            manuell_ueberschrieben=zeile.manuell_ueberschrieben,
         )
-    return ziele
+        for zeile in zeilen
+        if (name := zeile.servername.strip())
+    ]
 
 
 def _rollenquelle_fuer_zeile(zeile: ServerTabellenZeile) -> str:
@@ -117,26 +174,38 @@ def _rollenquelle_fuer_zeile(zeile: ServerTabellenZeile) -> str:
     return "manuell gesetzt"
 
 
-def _deklarationszusammenfassung(ziele: list[ServerZiel], zeilen: list[ServerTabellenZeile]) -> str:
-    """Erzeugt eine lesbare Zusammenfassung vor Ausführung der Analyse."""
-    quelle_pro_server = {normalisiere_servernamen(zeile.servername): zeile.quelle for zeile in zeilen}
-    zusammenfassung = ["So wurden die Server deklariert:"]
+def _deklarationszusammenfassung(
+    ziele: list[ServerZiel],
+    zeilen: Sequence[ServerTabellenZeile],
+    *,
+    quelle_pro_server: Mapping[str, str] | None = None,
+) -> str:
+    """Erzeugt eine lesbare Zusammenfassung vor Ausführung der Analyse.
+
+    Liegt bereits eine Zuordnung normalisierter Servername -> Quelle vor, wird sie statt der Zeilen genutzt.
+    """
+    if quelle_pro_server is None:
+        quelle_pro_server = {zeile.name_norm: zeile.quelle for zeile in zeilen}
+    quelle_fuer = quelle_pro_server.get
+    puffer = io.StringIO()
+    schreibe = puffer.write
+    schreibe("So wurden die Server deklariert:")
     for index, ziel in enumerate(ziele, start=1):
         rollen = ", ".join(ziel.rollen) if ziel.rollen else "keine Rolle gesetzt"
-        quelle_roh = quelle_pro_server.get(normalisiere_servernamen(ziel.name), "unbekannt")
+        quelle_roh = quelle_fuer(normalisiere_servernamen(ziel.name), "unbekannt")
         quelle = "Netzwerkerkennung" if quelle_roh.lower() == "discovery" else quelle_roh
-        zusammenfassung.append(
-            f"{index}. {ziel.name} | Rollen: {rollen} | Quelle: {quelle} | Rollenquelle: {ziel.rollenquelle or 'unbekannt'}"
+        schreibe(
+            f"\n{index}. {ziel.name} | Rollen: {rollen} | Quelle: {quelle} | Rollenquelle: {ziel.rollenquelle or 'unbekannt'}"
         )
-    return "\n".join(zusammenfassung)
+    return puffer.getvalue()
 
 
 def _kurzstatus(ergebnis: AnalyseErgebnis) -> str:
     """Erzeugt einen kompakten Statussatz je Server für die aufklappbare Liste."""
-    offene_ports = [str(port.port) for port in ergebnis.ports if port.offen]
-    rollen = ", ".join(ergebnis.rollen) if ergebnis.rollen else "nicht gesetzt/ermittelt"
+    offene_ports = ", ".join(str(port.port) for port in ergebnis.ports if port.offen) or "keine"
+    rollen = ", ".join(ergebnis.rollen) or "nicht gesetzt/ermittelt"
     quelle = ergebnis.rollenquelle or "unbekannt"
-    return f"Rollen: {rollen} | Quelle: {quelle} | Offene Ports: {', '.join(offene_ports) if offene_ports else 'keine'}"
+    return f"Rollen: {rollen} | Quelle: {quelle} | Offene Ports: {offene_ports}"
 
 
 def _baue_executive_summary(ergebnisse: list[AnalyseErgebnis]) -> list[str]:
@@ -149,14 +218,20 @@ def _baue_executive_summary(ergebnisse: list[AnalyseErgebnis]) -> list[str]:
     warnungen = 0
     hinweise = 0
 
+    kritische_ports = _KRITISCHE_PORTS
     for ergebnis in ergebnisse:
         for rolle in ergebnis.rollen:
             if rolle in rollenverteilung:
                 rollenverteilung[rolle] += 1
-        offene_kritische_ports += sum(1 for port in ergebnis.ports if port.offen and port.port in _KRITISCHE_PORTS)
-        warnungen += sum(1 for port in ergebnis.ports if not port.offen)
-        warnungen += len(ergebnis.hinweise)
-        hinweise += len(ergebnis.hinweise)
+        # Ein Durchlauf über die Ports zählt kritische offene und geschlossene Ports gemeinsam.
+        for port in ergebnis.ports:
+            if not port.offen:
+                warnungen += 1
+            elif port.port in kritische_ports:
+                offene_kritische_ports += 1
+        anzahl_hinweise = len(ergebnis.hinweise)
+        warnungen += anzahl_hinweise
+        hinweise += anzahl_hinweise
 
     return [
         f"Analysierte Server: {len(ergebnisse)}",
@@ -213,18 +288,22 @@ def _baue_server_summary(ergebnisse: list[AnalyseErgebnis]) -> list[dict[str, ob
     return server_summary
 
 
-def _mappe_manuelle_anmerkungen(zeilen: list[ServerTabellenZeile]) -> dict[str, str]:
+def _mappe_manuelle_anmerkungen(zeilen: Sequence[ServerTabellenZeile]) -> dict[str, str]:
     """Liefert eine normalisierte Zuordnung von Servernamen zu manuellen Ergänzungen."""
     return {
-        normalisiere_servernamen(zeile.servername): zeile.manuelle_anmerkung.strip()
+        zeile.name_norm: zeile.manuelle_anmerkung.strip()
         for zeile in zeilen
         if zeile.servername.strip() and zeile.manuelle_anmerkung.strip()
     }
 
 
-def _integriere_manuelle_anmerkungen(ergebnisse: list[AnalyseErgebnis], zeilen: list[ServerTabellenZeile]) -> None:
+def _integriere_manuelle_anmerkungen(ergebnisse: list[AnalyseErgebnis], zeilen: Sequence[ServerTabellenZeile]) -> None:
     """Erweitert Analyseergebnisse um manuelle Hinweise für GUI und Markdown-Report."""
-    anmerkungen_pro_server = _mappe_manuelle_anmerkungen(zeilen)
+    _wende_manuelle_anmerkungen_an(ergebnisse, _mappe_manuelle_anmerkungen(zeilen))
+
+
+def _wende_manuelle_anmerkungen_an(ergebnisse: list[AnalyseErgebnis], anmerkungen_pro_server: Mapping[str, str]) -> None:
+    """Übernimmt bereits normalisiert zugeordnete Anmerkungen in die Analyseergebnisse."""
     if not anmerkungen_pro_server:
         return
 
@@ -239,13 +318,19 @@ def _integriere_manuelle_anmerkungen(ergebnisse: list[AnalyseErgebnis], zeilen:
             ergebnis.hinweise.append(anmerkung)
 
 
-def _schreibe_analyse_report(ergebnisse: list[AnalyseErgebnis], ausgabe_pfad: str) -> tuple[str, str]:
-    """Rendert und schreibt den Analysebericht in den gewünschten Dateipfad."""
+def _schreibe_analyse_report(ergebnisse: list[AnalyseErgebnis], ausgabe_pfad: str, quelle: str | None = None) -> tuple[str, str]:
+    """Rendert und schreibt den Analysebericht in den gewünschten Dateipfad; `quelle` markiert wiederverwendete Ergebnisse."""
     zielpfad = Path(ausgabe_pfad).expanduser()
-    markdown = render_markdown(ergebnisse, berichtsmodus="voll")
     zielpfad.parent.mkdir(parents=True, exist_ok=True)
-    zielpfad.write_text(markdown, encoding="utf-8")
-    return str(zielpfad), datetime.now().isoformat(timespec="seconds")
+    # Abschnittsweise schreiben: der Speicherbedarf bleibt bei einem Serverblock statt beim Gesamtbericht.
+    with zielpfad.open("w", encoding="utf-8", buffering=_REPORT_PUFFERGROESSE) as datei:
+        datei.writelines(iter_markdown_abschnitte(ergebnisse, berichtsmodus="voll", quelle=quelle))
+    return str(zielpfad), time.strftime(_EXPORT_ZEITFORMAT)
+
+
+def _versionsliste(versionen: Sequence[KomponentenVersion]) -> str:
+    """Fasst Versionseinträge zu einer kommagetrennten Zeile zusammen."""
+    return ", ".join(f"{v.produkt} {v.version} ({v.quelle or 'Quelle unbekannt'})" for v in versionen) or "keine"
 
 
 def _drilldown_knoten(ergebnis: AnalyseErgebnis) -> dict[str, list[str]]:
@@ -255,18 +340,19 @@ def _drilldown_knoten(ergebnis: AnalyseErgebnis) -> dict[str, list[str]]:
         f"{rolle}: {' | '.join(details)}" for rolle, details in karte.rollen_karten.items()
     ]
     ports = [
-        f"Port {port.port} ({port.bezeichnung}): {'offen' if port.offen else 'blockiert/unerreichbar'}" for port in ergebnis.ports
+        f"Port {port.port} ({port.bezeichnung}): {_PORT_STATUS[bool(port.offen)]}" for port in ergebnis.ports
     ] or ["Keine Portdaten verfügbar"]
+    app = ergebnis.rollen_details.app
     pfade_und_freigaben = [
-        f"Installpfade: {', '.join(ergebnis.rollen_details.app.installpfade) or 'keine'}",
-        f"Freigaben: {', '.join(ergebnis.rollen_details.app.freigaben) or 'keine'}",
-        f"Liveupdate: {', '.join(ergebnis.rollen_details.app.liveupdate_pfade) or 'keine'}",
-        f"Zusatzablagen: {', '.join(ergebnis.rollen_details.app.zusatzablagen) or 'keine'}",
+        f"Installpfade: {', '.join(app.installpfade) or 'keine'}",
+        f"Freigaben: {', '.join(app.freigaben) or 'keine'}",
+        f"Liveupdate: {', '.join(app.liveupdate_pfade) or 'keine'}",
+        f"Zusatzablagen: {', '.join(app.zusatzablagen) or 'keine'}",
     ]
     versionen = [
-        "Sage-Versionen: " + (", ".join(f"{v.produkt} {v.version} ({v.quelle or 'Quelle unbekannt'})" for v in karte.sage_versionen) or "keine"),
-        ".NET-Versionen: " + (", ".join(f"{v.produkt} {v.version} ({v.quelle or 'Quelle unbekannt'})" for v in karte.dotnet_versionen) or "keine"),
-        "Management-Versionen: " + (", ".join(f"{v.produkt} {v.version} ({v.quelle or 'Quelle unbekannt'})" for v in karte.management_versionen) or "keine"),
+        f"Sage-Versionen: {_versionsliste(karte.sage_versionen)}",
+        f".NET-Versionen: {_versionsliste(karte.dotnet_versionen)}",
+        f"Management-Versionen: {_versionsliste(karte.management_versionen)}",
     ]
     return {
         "Rollenprüfung": rollenpruefung,
@@ -276,7 +362,7 @@ def _drilldown_knoten(ergebnis: AnalyseErgebnis) -> dict[str, list[str]]:
     }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryTabellenTreffer:
     """Bearbeitbares GUI-Modell für Discovery-Treffer vor der Übernahme."""
 
@@ -288,6 +374,20 @@ class DiscoveryTabellenTreffer:
     rollenhinweise: tuple[str, ...] = ()
     namensquelle: str | None = None
     erklaerung: str = ""
+    # Rohliste der erkannten Dienste; erspart das erneute Zerlegen von `dienste` bei der Rollenableitung.
+    erkannte_dienste: tuple[str, ...] = ()
+    # Kleingeschriebene Suchschlüssel werden einmalig vorberechnet, damit der Filter je Tastendruck nur vergleicht.
+    hostname_lc: str = field(init=False, repr=False, compare=False, default="")
+    ip_lc: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self.hostname_lc = self.hostname.lower()
+        self.ip_lc = self.ip_adresse.lower()
+
+    def setze_hostname(self, hostname: str) -> None:
+        """Aktualisiert den Hostnamen inklusive vorberechnetem Suchschlüssel."""
+        self.hostname = hostname
+        self.hostname_lc = hostname.lower()
 
 
 @dataclass
@@ -367,6 +467,9 @@ def _erklaerung_aus_treffer(treffer: DiscoveryTabellenTreffer) -> str:
     return " | ".join(teile)
 
 
+# Wartezeit nach dem letzten Tastendruck, bevor der Discovery-Filter neu angewendet wird.
+_FILTER_DEBOUNCE_MS = 150
+
 _VERTRAUENS_TOOLTIP_TEXT = (
     "Bewertungslogik des Vertrauensgrads:\n"
     "• ICMP-Erreichbarkeit: +0,45\n"
@@ -425,22 +528,48 @@ def _filter_discovery_treffer(
     Nicht erreichbare Treffer werden standardmäßig ausgeblendet, wenn
     ``nur_erreichbare`` aktiv ist.
     """
-    suchbegriff = filtertext.strip().lower()
-    gefiltert: list[DiscoveryTabellenTreffer] = []
-    for treffer in treffer_liste:
-        if nur_erreichbare and not treffer.erreichbar:
-            continue
-        if suchbegriff and suchbegriff not in treffer.hostname.lower() and suchbegriff not in treffer.ip_adresse.lower():
-            continue
-        gefiltert.append(treffer)
-    return gefiltert
+    suchbegriff = filtertext.strip()
+    if not suchbegriff:
+        if not nur_erreichbare:
+            return list(treffer_liste)
+        return [treffer for treffer in treffer_liste if treffer.erreichbar]
+    if suchbegriff.isascii() and suchbegriff.replace(".", "").isdigit():
+        # IP-artige Suchbegriffe benötigen kein Lowercasing und treffen meist die Adresse,
+        # daher wird sie zuerst geprüft; Hostnamen mit Ziffern bleiben weiterhin auffindbar.
+        return [
+            treffer
+            for treffer in treffer_liste
+            if (treffer.erreichbar or not nur_erreichbare)
+            and (suchbegriff in treffer.ip_adresse or suchbegriff in treffer.hostname_lc)
+        ]
+    suchbegriff = suchbegriff.lower()
+    return [
+        treffer
+        for treffer in treffer_liste
+        if (treffer.erreichbar or not nur_erreichbare)
+        and (suchbegriff in treffer.hostname_lc or suchbegriff in treffer.ip_lc)
+    ]
+
+
+# Spaltenaufbau des Discovery-Dialogs als (Spalte, Titel, Breite, Ausrichtung), analog zu `_SPALTEN_LAYOUT`.
+_DISCOVERY_SPALTEN_LAYOUT = (
+    ("hostname", "Hostname (bearbeitbar)", 220, "w"),
+    ("ip", "IP", 150, "w"),
+    ("erreichbar", "Erreichbar", 90, "center"),
+    ("dienste", "Dienste", 180, "w"),
+    ("namensquelle", "Namensquelle", 120, "center"),
+    ("vertrauen", "Vertrauensgrad", 150, "center"),
+    ("erklaerung", "Erklärung", 320, "w"),
+)
+
 
 class DiscoveryTrefferDialog:
     """Dialog zur Auswahl, Filterung und Korrektur von Discovery-Treffern."""
 
     def __init__(self, parent: tk.Misc, treffer: list[DiscoveryErgebnis]) -> None:
-        self._treffer = [
-            DiscoveryTabellenTreffer(
+        self._treffer: list[DiscoveryTabellenTreffer] = []
+        for item in treffer:
+            eintrag = DiscoveryTabellenTreffer(
                 hostname=item.hostname,
                 ip_adresse=item.ip_adresse,
                 erreichbar=item.erreichbar,
@@ -448,12 +577,10 @@ class DiscoveryTrefferDialog:
                 vertrauensgrad=item.vertrauensgrad,
                 rollenhinweise=tuple(item.rollenhinweise),
                 namensquelle=item.namensquelle,
-                erklaerung="",
+                erkannte_dienste=tuple(item.erkannte_dienste),
             )
-            for item in treffer
-        ]
-        for eintrag in self._treffer:
             eintrag.erklaerung = _erklaerung_aus_treffer(eintrag)
+            self._treffer.append(eintrag)
         self.ausgewaehlt: list[DiscoveryTabellenTreffer] = []
 
         self.window = tk.Toplevel(parent)
@@ -463,7 +590,11 @@ class DiscoveryTrefferDialog:
         self.window.grab_set()
 
         self.filter_var = tk.StringVar(value="")
-        self.filter_var.trace_add("write", lambda *_: self._render_treffer())
+        self._render_after_id: str | None = None
+        # Aktives Inline-Eingabefeld zur Hostname-Korrektur samt bearbeiteter Zeile (höchstens eines gleichzeitig).
+        self._inline_editor: ttk.Entry | None = None
+        self._inline_editor_item: str | None = None
+        self.filter_var.trace_add("write", self._plane_render)
         # Standardfilter: Fokus auf tatsächlich erreichbare Systeme.
         self.nur_erreichbare_var = tk.BooleanVar(value=True)
         self.zeige_rohwert_var = tk.BooleanVar(value=False)
@@ -483,7 +614,7 @@ class DiscoveryTrefferDialog:
             kopf,
             text="Rohwert zusätzlich anzeigen",
             variable=self.zeige_rohwert_var,
-            command=self._render_treffer,
+            command=self._aktualisiere_vertrauensanzeige,
         ).pack(side="left", padx=(4, 4))
         hinweis_label = ttk.Label(kopf, text="ℹ Bewertungslogik", cursor="hand2")
         hinweis_label.pack(side="left", padx=(6, 4))
@@ -495,60 +626,82 @@ class DiscoveryTrefferDialog:
 
         self.tree = ttk.Treeview(
             self.window,
-            columns=("hostname", "ip", "erreichbar", "dienste", "namensquelle", "vertrauen", "erklaerung"),
+            columns=tuple(spalte for spalte, *_ in _DISCOVERY_SPALTEN_LAYOUT),
             show="headings",
             selectmode="extended",
             height=17,
         )
         self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
-        self.tree.heading("hostname", text="Hostname (bearbeitbar)")
-        self.tree.heading("ip", text="IP")
-        self.tree.heading("erreichbar", text="Erreichbar")
-        self.tree.heading("dienste", text="Dienste")
-        self.tree.heading("namensquelle", text="Namensquelle")
-        self.tree.heading("vertrauen", text="Vertrauensgrad")
-        self.tree.heading("erklaerung", text="Erklärung")
-        self.tree.column("hostname", width=220)
-        self.tree.column("ip", width=150)
-        self.tree.column("erreichbar", width=90, anchor="center")
-        self.tree.column("dienste", width=180)
-        self.tree.column("namensquelle", width=120, anchor="center")
-        self.tree.column("vertrauen", width=150, anchor="center")
-        self.tree.column("erklaerung", width=320)
+        for spalte, titel, breite, ausrichtung in _DISCOVERY_SPALTEN_LAYOUT:
+            self.tree.heading(spalte, text=titel)
+            self.tree.column(spalte, width=breite, anchor=ausrichtung)
         self.tree.bind("<Double-1>", self._bearbeite_hostname)
 
         self._id_zu_treffer: dict[str, DiscoveryTabellenTreffer] = {}
+        self._sichtbare_ids: set[str] = set()
+        self._letzter_filter: tuple[str, bool] | None = None
+        self._befuelle_tabelle()
         self._render_treffer()
 
-    def _render_treffer(self) -> None:
-        for item_id in self.tree.get_children(""):
-            self.tree.delete(item_id)
-        self._id_zu_treffer.clear()
-
-        gefilterte_treffer = _filter_discovery_treffer(
-            self._treffer,
-            filtertext=self.filter_var.get(),
-            nur_erreichbare=self.nur_erreichbare_var.get(),
+    def _zeilenwerte(self, treffer: DiscoveryTabellenTreffer) -> tuple[str, ...]:
+        """Formatiert einen Treffer als Werte-Tupel für die Tabellenzeile."""
+        return (
+            treffer.hostname,
+            treffer.ip_adresse,
+            _JA_NEIN[bool(treffer.erreichbar)],
+            treffer.dienste,
+            _namensquelle_anzeige(treffer.namensquelle),
+            _formatiere_vertrauensanzeige(
+                treffer.vertrauensgrad,
+                zeige_rohwert=self.zeige_rohwert_var.get(),
+            ),
+            treffer.erklaerung,
         )
-        for treffer in gefilterte_treffer:
-            item_id = self.tree.insert(
-                "",
-                "end",
-                values=(
-                    treffer.hostname,
-                    treffer.ip_adresse,
-                    "ja" if treffer.erreichbar else "nein",
-                    treffer.dienste,
-                    _namensquelle_anzeige(treffer.namensquelle),
-                    _formatiere_vertrauensanzeige(
-                        treffer.vertrauensgrad,
-                        zeige_rohwert=self.zeige_rohwert_var.get(),
-                    ),
-                    treffer.erklaerung,
-                ),
-            )
+
+    def _befuelle_tabelle(self) -> None:
+        """Legt alle Treffer einmalig an; Filterwechsel blenden Zeilen danach nur noch ein/aus."""
+        for treffer in self._treffer:
+            item_id = self.tree.insert("", "end", values=self._zeilenwerte(treffer))
             self._id_zu_treffer[item_id] = treffer
+            self._sichtbare_ids.add(item_id)
 
+    def _plane_render(self, *_: object) -> None:
+        """Bündelt schnelle Tastatureingaben, damit nur der letzte Filterstand gerendert wird."""
+        if self._render_after_id is not None:
+            self.window.after_cancel(self._render_after_id)
+        self._render_after_id = self.window.after(_FILTER_DEBOUNCE_MS, self._render_treffer)
+
+    def _render_treffer(self) -> None:
+        """Setzt die sichtbaren Zeilen passend zum aktuellen Filter mit einem einzigen Tk-Aufruf."""
+        self._render_after_id = None
+        filter_schluessel = (self.filter_var.get().strip().lower(), self.nur_erreichbare_var.get())
+        if filter_schluessel == self._letzter_filter:
+            return
+        self._letzter_filter = filter_schluessel
+
+        passende = {
+            id(treffer)
+            for treffer in _filter_discovery_treffer(
+                self._treffer,
+                filtertext=filter_schluessel[0],
+                nur_erreichbare=filter_schluessel[1],
+            )
+        }
+        sichtbar = [item_id for item_id, treffer in self._id_zu_treffer.items() if id(treffer) in passende]
+        # `children` ersetzt die Kinderliste in Tk komplett: nicht enthaltene Zeilen werden getrennt,
+        # die übrigen stehen danach in ursprünglicher Reihenfolge – statt je Zeile move()/detach().
+        self.tree.set_children("", *sichtbar)
+        self._sichtbare_ids = set(sichtbar)
+
+    def _aktualisiere_vertrauensanzeige(self) -> None:
+        """Aktualisiert nur die Vertrauensspalte, wenn der Rohwert ein- oder ausgeblendet wird."""
+        zeige_rohwert = self.zeige_rohwert_var.get()
+        for item_id, treffer in self._id_zu_treffer.items():
+            self.tree.set(
+                item_id,
+                "vertrauen",
+                _formatiere_vertrauensanzeige(treffer.vertrauensgrad, zeige_rohwert=zeige_rohwert),
+            )
 
     def _zeige_vertrauenstooltip(self, event: tk.Event[tk.Misc]) -> None:
         """Zeigt den Tooltip zur Vertrauensbewertung an."""
@@ -566,27 +719,51 @@ class DiscoveryTrefferDialog:
         column = self.tree.identify_column(event.x)
         if not item_id or column != "#1":
             return
-        aktueller = self._id_zu_treffer[item_id]
-        neuer_hostname = simpledialog.askstring(
-            "Hostname korrigieren",
-            "Hostname anpassen:",
-            parent=self.window,
-            initialvalue=aktueller.hostname,
-        )
-        if neuer_hostname is None:
+        zelle = self.tree.bbox(item_id, column)
+        if not zelle:
             return
-        aktueller.hostname = neuer_hostname.strip() or aktueller.hostname
-        self.tree.set(item_id, "hostname", aktueller.hostname)
+        self._beende_inline_editor(uebernehmen=True)
+
+        x, y, breite, hoehe = zelle
+        editor = ttk.Entry(self.tree)
+        editor.place(x=x, y=y, width=breite, height=hoehe)
+        editor.insert(0, self._id_zu_treffer[item_id].hostname)
+        editor.select_range(0, "end")
+        editor.focus_set()
+        self._inline_editor = editor
+        self._inline_editor_item = item_id
+
+        editor.bind("<Return>", lambda _event: self._beende_inline_editor(uebernehmen=True))
+        editor.bind("<FocusOut>", lambda _event: self._beende_inline_editor(uebernehmen=True))
+        editor.bind("<Escape>", lambda _event: self._beende_inline_editor())
+
+    def _beende_inline_editor(self, *, uebernehmen: bool = False) -> None:
+        """Schließt ein offenes Inline-Eingabefeld und übernimmt den Hostnamen auf Wunsch."""
+        editor, item_id = self._inline_editor, self._inline_editor_item
+        if editor is None or item_id is None:
+            return
+        self._inline_editor = None
+        self._inline_editor_item = None
+        if uebernehmen:
+            aktueller = self._id_zu_treffer[item_id]
+            aktueller.setze_hostname(editor.get().strip() or aktueller.hostname)
+            self.tree.set(item_id, "hostname", aktueller.hostname)
+        editor.destroy()
 
     def _uebernehmen(self) -> None:
-        self.ausgewaehlt = [self._id_zu_treffer[item_id] for item_id in self.tree.selection() if item_id in self._id_zu_treffer]
+        if self._render_after_id is not None:
+            self.window.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        self._beende_inline_editor(uebernehmen=True)
+        self.ausgewaehlt = [self._id_zu_treffer[item_id] for item_id in self.tree.selection() if item_id in self._sichtbare_ids]
         self.window.destroy()
 
 
 def _rollen_aus_discovery_treffer(treffer: DiscoveryTabellenTreffer) -> list[str]:
     """Leitet Rollenvorschläge über die gemeinsame Discovery-Heuristik ab."""
     return ableite_rollen_aus_discoveryindikatoren(
-        erkannte_dienste=[token.strip() for token in treffer.dienste.split(",") if token.strip()],
+        erkannte_dienste=list(treffer.erkannte_dienste)
+        or [token for token in (roh.strip() for roh in treffer.dienste.split(",")) if token],
         rollenhinweise=treffer.rollenhinweise,
         erreichbar=treffer.erreichbar,
     )
@@ -598,9 +775,9 @@ def _detailzeilen(ergebnis: AnalyseErgebnis) -> list[str]:
         f"Rollenquelle: {karte.rollenquelle or 'unbekannt'}",
     ]
 
+    anhaengen = details.append
     for check in karte.rollen_checks:
-        status = "erkannt" if check.erkannt else "nicht erkannt"
-        details.append(f"{check.rolle}-Prüfung: {status} | {' | '.join(check.details)}")
+        anhaengen(f"{check.rolle}-Prüfung: {_ERKANNT[bool(check.erkannt)]} | {' | '.join(check.details)}")
 
     if karte.freitext_hinweise:
         details.append("Hinweise:")
@@ -611,6 +788,107 @@ def _detailzeilen(ergebnis: AnalyseErgebnis) -> list[str]:
     return details
 
 
+# Tcl-Lambda für `apply`: setzt eine Treeview-Spalte für eine Liste von Items in einem Interpreter-Aufruf.
+_TCL_SETZE_SPALTE = "{tree items spalte wert} {foreach item $items {$tree set $item $spalte $wert}}"
+# Tcl-Lambda für `apply`: liefert die Zeilen-ID unter dem Mauszeiger, sofern der Klick in einer Zelle liegt.
+_TCL_KLICK_ZEILE = "{tree x y} {if {[$tree identify region $x $y] ne {cell}} {return {}}; $tree identify item $x $y}"
+
+# Standard-Gültigkeit zwischengespeicherter Discovery-Treffer; über `discovery_cache_ttl_s` im Modulzustand anpassbar.
+_DISCOVERY_CACHE_TTL_S = 300.0
+# Obergrenze gespeicherter Hosts im Discovery-Cache; älteste Einträge werden zuerst verdrängt (entspricht einem /20-Netz).
+_DISCOVERY_CACHE_MAX_EINTRAEGE = 4096
+
+# Obergrenze gleichzeitig analysierter Server; entspricht dem Standard von `analysiere_mehrere_server`.
+_ANALYSE_PARALLELITAET = 6
+
+# Gültigkeit des Analyse-Memos für unmittelbar wiederholte Läufe; über `analyse_cache_ttl_s` anpassbar.
+_ANALYSE_MEMO_TTL_S = 60.0
+
+
+def _analyse_memo_schluessel(ziele: Sequence[ServerZiel]) -> tuple[tuple[object, ...], ...]:
+    """Bildet einen hashbaren Schlüssel über alle analyserelevanten Felder der Serverziele."""
+    return tuple(
+        (ziel.name, tuple(ziel.rollen), ziel.rollenquelle, tuple(ziel.auto_rollen), ziel.manuell_ueberschrieben)
+        for ziel in ziele
+    )
+
+
+def _analyse_cache_hinweis(ergebnisse: Sequence[AnalyseErgebnis]) -> str:
+    """Beschreibt wiederverwendete Ergebnisse samt Stand des ursprünglichen Analyselaufs."""
+    stand = min((ergebnis.zeitpunkt for ergebnis in ergebnisse), default=None)
+    return f"Cache (Stand {stand.isoformat(timespec='seconds')})" if stand is not None else "Cache"
+
+
+class _DiscoveryTrefferCache:
+    """Prozessweiter TTL-Cache für Discovery-Ergebnisse einzelner Hosts inklusive leerer Treffer."""
+
+    def __init__(self, max_eintraege: int = _DISCOVERY_CACHE_MAX_EINTRAEGE) -> None:
+        # Nach Schreibzeitpunkt geordnet: abgelaufene und überzählige Einträge liegen stets vorn.
+        self._eintraege: OrderedDict[tuple[object, ...], tuple[float, list[DiscoveryErgebnis]]] = OrderedDict()
+        self._max_eintraege = max(1, max_eintraege)
+        # Laufende Abfragen je Schlüssel; parallele Anfragen für denselben Host teilen sich ein Future.
+        self._laufend: dict[tuple[object, ...], Future[list[DiscoveryErgebnis]]] = {}
+        self._sperre = threading.Lock()
+
+    def _speichere(self, schluessel: tuple[object, ...], treffer: list[DiscoveryErgebnis]) -> None:
+        """Legt einen Eintrag als jüngsten ab und verdrängt bei Überschreitung der Obergrenze die ältesten."""
+        eintraege = self._eintraege
+        eintraege[schluessel] = (time.monotonic(), list(treffer))
+        eintraege.move_to_end(schluessel)
+        while len(eintraege) > self._max_eintraege:
+            eintraege.popitem(last=False)
+
+    def _entferne_abgelaufene(self, ttl_s: float) -> None:
+        """Räumt abgelaufene Einträge vom ältesten Ende her ab; bricht beim ersten frischen Eintrag ab."""
+        eintraege = self._eintraege
+        grenze = time.monotonic() - ttl_s
+        while eintraege:
+            zeitpunkt = next(iter(eintraege.values()))[0]
+            if zeitpunkt > grenze:
+                break
+            eintraege.popitem(last=False)
+
+    def hole_oder_ermittle(
+        self,
+        schluessel: tuple[object, ...],
+        ttl_s: float,
+        ermittle: Callable[[], list[DiscoveryErgebnis]],
+    ) -> list[DiscoveryErgebnis]:
+        """Liefert frische Cache-Treffer oder ermittelt sie genau einmal, auch bei gleichzeitigen Anfragen."""
+        with self._sperre:
+            self._entferne_abgelaufene(ttl_s)
+            eintrag = self._eintraege.get(schluessel)
+            if eintrag is not None:
+                return list(eintrag[1])
+            laufend = self._laufend.get(schluessel)
+            if laufend is None:
+                eigenes: Future[list[DiscoveryErgebnis]] = Future()
+                self._laufend[schluessel] = eigenes
+        if laufend is not None:
+            return list(laufend.result())
+
+        try:
+            treffer = ermittle()
+        except BaseException as exc:
+            with self._sperre:
+                del self._laufend[schluessel]
+            eigenes.set_exception(exc)
+            raise
+        with self._sperre:
+            self._speichere(schluessel, treffer)
+            del self._laufend[schluessel]
+        eigenes.set_result(treffer)
+        return list(treffer)
+
+    def leere(self) -> None:
+        """Verwirft alle gespeicherten Treffer, z. B. nachdem ein Host neu gestartet wurde."""
+        with self._sperre:
+            self._eintraege.clear()
+
+
+_DISCOVERY_CACHE = _DiscoveryTrefferCache()
+
+
 class MehrserverAnalyseGUI:
     """Tkinter-Controller für Mehrserver-Erfassung, Discovery und Ergebnisdarstellung."""
 
@@ -632,9 +910,16 @@ class MehrserverAnalyseGUI:
         )
 
         self._zeilen_nach_id: dict[str, ServerTabellenZeile] = {}
+        # Normalisierter Servername -> Item-ID; O(1)-Duplikatprüfung und Zeilensuche je Server.
+        self._id_nach_norm_name: dict[str, str] = {}
+        # Serialisierte Zeilen samt Rollen je Item-ID für `speichern`; Änderungen an einer Zeile verwerfen ihren Eintrag.
+        self._serialisiert_nach_id: dict[str, tuple[dict[str, object], list[str]]] = {}
         self._letzte_ergebnisse: list[AnalyseErgebnis] = []
-        # Strukturierte Detailkarten dienen als gemeinsame Datenbasis für Tabs und Reporting.
-        self._detailkarten: list[ServerDetailkarte] = []
+        # Detailkarten werden erst bei Auswahl eines Servers aufgebaut und danach je Server zwischengespeichert.
+        self._ergebnis_nach_server: dict[str, AnalyseErgebnis] = {}
+        self._detailkarten: dict[str, ServerDetailkarte] = {}
+        # Rohergebnisse des letzten vollständigen Laufs (ohne manuelle Anmerkungen) samt Zeitstempel.
+        self._analyse_memo: dict[tuple[tuple[object, ...], ...], tuple[float, list[AnalyseErgebnis]]] = {}
         self._server_auswahl_var = tk.StringVar(value="")
         self._manuelle_anmerkung_var = tk.StringVar(value="")
         # Strukturierter Snapshot der letzten Analyse für modulübergreifende Übersichten.
@@ -653,6 +938,8 @@ class MehrserverAnalyseGUI:
         self._letzter_export_pfad = self.modulzustand.get("letzter_exportpfad", "")
         self._letzter_exportzeitpunkt = self.modulzustand.get("letzter_exportzeitpunkt", "")
         self._letzte_export_lauf_id = self.modulzustand.get("letzte_export_lauf_id", "")
+        # Fingerabdruck des zuletzt geschriebenen Persistenzstands, um unveränderte Automatik-Speicherungen zu überspringen.
+        self._letzter_persistenz_hash: int | None = None
         self._report_verweis_var = tk.StringVar(
             value=_baue_report_verweistext(
                 self._letzter_export_pfad,
@@ -667,6 +954,10 @@ class MehrserverAnalyseGUI:
         self._lauf_verarbeitet = 0
         self._lauf_gesamt = 0
         self._laufzeiten_pro_host: list[float] = []
+        # Gemeinsamer Worker-Pool für Discovery-Hostprüfungen und Serveranalysen; wird beim ersten Lauf erzeugt.
+        self._executor: ThreadPoolExecutor | None = None
+        # Verschachtelungstiefe aktiver Massenänderungen; > 0 unterdrückt Button-Aktualisierungen.
+        self._button_update_suspendiert = 0
 
         self._baue_formular(self.shell.content_frame)
         self._baue_tabelle(self.shell.content_frame)
@@ -681,8 +972,24 @@ class MehrserverAnalyseGUI:
             self._abbruch_anfordern()
             self.shell.zeige_info("Lauf aktiv", "Die Oberfläche wird geschlossen, sobald der aktuelle Hostlauf beendet ist.", "Warten Sie einen Moment und schließen Sie danach erneut.")
             return
+        self._beende_executor()
         self.master.destroy()
 
+    def _hole_executor(self) -> ThreadPoolExecutor:
+        """Liefert den über die Lebensdauer der Oberfläche geteilten Worker-Pool."""
+        executor = getattr(self, "_executor", None)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max(1, DiscoveryKonfiguration().max_worker), thread_name_prefix="sm")
+            self._executor = executor
+        return executor
+
+    def _beende_executor(self) -> None:
+        """Gibt den Worker-Pool frei und verwirft noch nicht gestartete Aufgaben."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def _baue_formular(self, parent: ttk.Frame) -> None:
         form_frame = ttk.LabelFrame(parent, text="Serverdeklaration", style="Section.TLabelframe")
         form_frame.pack(fill="x", pady=(0, 8))
@@ -759,24 +1066,9 @@ class MehrserverAnalyseGUI:
         self.tree = ttk.Treeview(table_frame, columns=_SPALTEN, show="headings", height=11)
         self.tree.pack(side="left", fill="both", expand=True, padx=(8, 0), pady=8)
 
-        for spalte, titel in {
-            _SPALTE_SERVERNAME: "Servername",
-            _SPALTE_SQL: "SQL",
-            _SPALTE_APP: "APP",
-            _SPALTE_CTX: "CTX",
-            _SPALTE_DC: "DC",
-            _SPALTE_QUELLE: "Quelle",
-            _SPALTE_STATUS: "Status",
-        }.items():
+        for spalte, titel, breite, ausrichtung in _SPALTEN_LAYOUT:
             self.tree.heading(spalte, text=titel)
-
-        self.tree.column(_SPALTE_SERVERNAME, width=220)
-        self.tree.column(_SPALTE_SQL, width=70, anchor="center")
-        self.tree.column(_SPALTE_APP, width=70, anchor="center")
-        self.tree.column(_SPALTE_CTX, width=70, anchor="center")
-        self.tree.column(_SPALTE_DC, width=70, anchor="center")
-        self.tree.column(_SPALTE_QUELLE, width=130)
-        self.tree.column(_SPALTE_STATUS, width=180)
+            self.tree.column(spalte, width=breite, anchor=ausrichtung)
 
         scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
         scrollbar.pack(side="right", fill="y", pady=8, padx=8)
@@ -799,6 +1091,18 @@ class MehrserverAnalyseGUI:
             command=self.discovery_servernamen_starten,
         )
         self.btn_discovery_namen.pack(side="left", padx=4)
+        ttk.Button(
+            action_frame,
+            text="Erkennungs-Cache leeren",
+            style="Secondary.TButton",
+            command=self.discovery_cache_leeren,
+        ).pack(side="left", padx=4)
+        ttk.Button(
+            action_frame,
+            text="Analyse-Cache leeren",
+            style="Secondary.TButton",
+            command=self.analyse_cache_leeren,
+        ).pack(side="left", padx=4)
         self.btn_loeschen = ttk.Button(
             action_frame,
             text="Ausgewählten Eintrag löschen",
@@ -885,14 +1189,23 @@ class MehrserverAnalyseGUI:
     def _setze_textfeld_inhalt(self, textfeld: tk.Text, zeilen: list[str]) -> None:
         """Schreibt Zeilen konsistent in ein Tab-Textfeld."""
         textfeld.configure(state="normal")
-        textfeld.delete("1.0", "end")
-        textfeld.insert("1.0", "\n".join(zeilen) if zeilen else "Keine Daten vorhanden.")
+        # Löschen und Einfügen in einem Tcl-Aufruf; der Inhalt wird so nur einmal neu umbrochen.
+        textfeld.replace("1.0", "end", "\n".join(zeilen) if zeilen else "Keine Daten vorhanden.")
         textfeld.configure(state="disabled")
 
+    def _detailkarte_fuer(self, servername: str) -> ServerDetailkarte | None:
+        """Liefert die Detailkarte eines Servers und baut sie beim ersten Zugriff auf."""
+        karte = self._detailkarten.get(servername)
+        if karte is None:
+            ergebnis = self._ergebnis_nach_server.get(servername)
+            if ergebnis is None:
+                return None
+            karte = self._detailkarten[servername] = baue_server_detailkarte(ergebnis)
+        return karte
+
     def _aktualisiere_tab_inhalte(self) -> None:
         """Aktualisiert alle Ergebnis-Tabs anhand der aktuell gewählten Serverkarte."""
-        servername = self._server_auswahl_var.get().strip()
-        karte = next((eintrag for eintrag in self._detailkarten if eintrag.server == servername), None)
+        karte = self._detailkarte_fuer(self._server_auswahl_var.get().strip())
         if not karte:
             self._manuelle_anmerkung_var.set("")
             for feld in (
@@ -905,10 +1218,7 @@ class MehrserverAnalyseGUI:
                 self._setze_textfeld_inhalt(feld, ["Noch kein Server ausgewählt."])
             return
 
-        zeile = next(
-            (eintrag for eintrag in self._zeilen_nach_id.values() if normalisiere_servernamen(eintrag.servername) == normalisiere_servernamen(karte.server)),
-            None,
-        )
+        zeile = self._zeile_fuer_server(karte.server)
         self._manuelle_anmerkung_var.set((zeile.manuelle_anmerkung if zeile else "").strip())
 
         self._setze_textfeld_inhalt(
@@ -951,14 +1261,16 @@ class MehrserverAnalyseGUI:
         anmerkung = self._manuelle_anmerkung_var.get().strip()
         norm_name = normalisiere_servernamen(servername)
 
-        for zeile in self._zeilen_nach_id.values():
-            if normalisiere_servernamen(zeile.servername) == norm_name:
-                zeile.manuelle_anmerkung = anmerkung
-                break
+        item_id = self._id_nach_norm_name.get(norm_name)
+        if item_id is not None:
+            self._zeilen_nach_id[item_id].manuelle_anmerkung = anmerkung
+            self._verwerfe_serialisierung((item_id,))
 
         for ergebnis in self._letzte_ergebnisse:
             if normalisiere_servernamen(ergebnis.server) != norm_name:
                 continue
+            # Hinweise ändern sich; die Karte wird bei der nächsten Auswahl neu aufgebaut.
+            self._detailkarten.pop(ergebnis.server, None)
             vorherige_anmerkung = ergebnis.manuelle_anmerkung.strip()
             ergebnis.hinweise = [
                 hinweis
@@ -1055,6 +1367,7 @@ class MehrserverAnalyseGUI:
         worker,
         bei_erfolg,
         bei_fehler,
+        bei_fortschritt: Callable[[dict[str, object]], None] | None = None,
     ) -> None:
         """Startet Discovery/Analyse in separatem Thread und pollt Ergebnisse."""
         worker_thread = getattr(self, "_worker_thread", None)
@@ -1072,7 +1385,9 @@ class MehrserverAnalyseGUI:
                 worker(ereignisse, self._abbruch_event or threading.Event())
                 while not ereignisse.empty():
                     typ, daten = ereignisse.get_nowait()
-                    if typ == "abgeschlossen":
+                    if typ == "fortschritt" and bei_fortschritt is not None and isinstance(daten, dict):
+                        bei_fortschritt(daten)
+                    elif typ == "abgeschlossen":
                         self._setze_laufstatus(False)
                         bei_erfolg(daten)
                     elif typ == "fehler":
@@ -1102,6 +1417,8 @@ class MehrserverAnalyseGUI:
                 if typ == "fortschritt":
                     payload = daten if isinstance(daten, dict) else {}
                     self._aktualisiere_lauffortschritt(int(payload.get("verarbeitet", 0) or 0), float(payload.get("dauer", 0.0) or 0.0))
+                    if bei_fortschritt is not None:
+                        bei_fortschritt(payload)
                 elif typ == "abgeschlossen":
                     self._setze_laufstatus(False)
                     bei_erfolg(daten)
@@ -1115,8 +1432,21 @@ class MehrserverAnalyseGUI:
 
         master.after(120, _poll)
 
+    @contextmanager
+    def _bulk(self) -> Iterator[None]:
+        """Fasst mehrere Tabellenänderungen zusammen und aktualisiert Buttons nur einmal am Ende."""
+        self._button_update_suspendiert = getattr(self, "_button_update_suspendiert", 0) + 1
+        try:
+            yield
+        finally:
+            self._button_update_suspendiert -= 1
+            if not self._button_update_suspendiert:
+                self._aktualisiere_button_zustaende()
+
     def _aktualisiere_button_zustaende(self, _event: tk.Event[tk.Misc] | None = None) -> None:
         """Aktiviert oder deaktiviert Aktionen abhängig vom aktuellen GUI-Zustand."""
+        if getattr(self, "_button_update_suspendiert", 0):
+            return
         servername = self.entry_servername.get().strip()
         hat_server = bool(servername)
         if self._lauf_aktiv:
@@ -1139,59 +1469,77 @@ class MehrserverAnalyseGUI:
     def _lade_serverliste_aus_status(self) -> None:
         """Stellt gespeicherte Serverlisten beim Start der GUI wieder her."""
         gespeicherte_zeilen = self.modulzustand.get("serverlisten", [])
+        zeilen: list[ServerTabellenZeile] = []
         for zeile_dict in gespeicherte_zeilen:
             try:
-                self._fuege_zeile_ein(ServerTabellenZeile(**zeile_dict))
-            except TypeError:
+                zeilen.append(ServerTabellenZeile(**zeile_dict))
+            except (TypeError, AttributeError):
                 logger.warning("Ungültiger Servereintrag in gui_state.json wurde übersprungen: %s", zeile_dict)
+        self._fuege_zeilen_ein(zeilen)
 
-    def _exists_server(self, servername: str) -> bool:
-        suchwert = normalisiere_servernamen(servername)
-        return any(normalisiere_servernamen(zeile.servername) == suchwert for zeile in self._zeilen_nach_id.values())
+    def _rows(self) -> tuple[ServerTabellenZeile, ...]:
+        """Liefert alle Tabellenzeilen in Einfüge-Reihenfolge.
+
+        Nur das Tupel ist eine Kopie; die enthaltenen Zeilenobjekte sind die live bearbeiteten Einträge.
+        """
+        return tuple(self._zeilen_nach_id.values())
 
-    def _fuege_zeile_ein(self, zeile: ServerTabellenZeile) -> None:
-        if self._exists_server(zeile.servername):
+    def _zeile_fuer_server(self, servername: str) -> ServerTabellenZeile | None:
+        """Liefert die Tabellenzeile eines Servers über den normalisierten Namensindex."""
+        item_id = self._id_nach_norm_name.get(normalisiere_servernamen(servername))
+        return self._zeilen_nach_id.get(item_id) if item_id is not None else None
+
+    def _fuege_zeile_ein(self, zeile: ServerTabellenZeile) -> str | None:
+        """Fügt eine Zeile ein und liefert die neue Item-ID oder `None` bei Duplikaten."""
+        name_norm = zeile.name_norm
+        if name_norm in self._id_nach_norm_name:
             logger.info("Server %s wird wegen Duplikat ignoriert.", zeile.servername)
-            return
+            return None
 
-        item_id = self.tree.insert(
-            "",
-            "end",
-            values=(
-                zeile.servername,
-                _checkbox_wert(zeile.sql),
-                _checkbox_wert(zeile.app),
-                _checkbox_wert(zeile.ctx),
-                _checkbox_wert(zeile.dc),
-                zeile.quelle,
-                zeile.status,
-            ),
-        )
+        item_id = self.tree.insert("", "end", values=_tree_values(zeile))
         self._zeilen_nach_id[item_id] = zeile
+        self._id_nach_norm_name[name_norm] = item_id
         self._aktualisiere_button_zustaende()
+        return item_id
+
+    def _fuege_zeilen_ein(self, zeilen: list[ServerTabellenZeile]) -> int:
+        """Fügt mehrere Zeilen in einem Durchlauf ein und liefert die Anzahl neu übernommener Server."""
+        insert = self.tree.insert
+        zeilen_nach_id = self._zeilen_nach_id
+        vorhandene = self._id_nach_norm_name
+        werte = _tree_values
+        eingefuegt = 0
+        with self._bulk():
+            for zeile in zeilen:
+                name_norm = zeile.name_norm
+                if name_norm in vorhandene:
+                    logger.info("Server %s wird wegen Duplikat ignoriert.", zeile.servername)
+                    continue
+                item_id = insert("", "end", values=werte(zeile))
+                zeilen_nach_id[item_id] = zeile
+                vorhandene[name_norm] = item_id
+                eingefuegt += 1
+        return eingefuegt
 
     def _toggle_rolle_per_klick(self, event: tk.Event[tk.Misc]) -> None:
-        region = self.tree.identify("region", event.x, event.y)
-        if region != "cell":
+        tree = self.tree
+        # Spalte zuerst prüfen: Klicks außerhalb der Rollenspalten benötigen keine weiteren Identify-Aufrufe.
+        treffer = _SPALTEN_KLICK_ATTR.get(tree.identify_column(event.x))
+        if treffer is None:
             return
-
-        item_id = self.tree.identify_row(event.y)
-        spalte = self.tree.identify_column(event.x)
-        if not item_id or not spalte:
-            return
-
-        spalten_index = int(spalte.replace("#", "")) - 1
-        spaltenname = _SPALTEN[spalten_index]
-        if spaltenname not in _ROLLEN_SPALTEN:
+        # Region und Zeile in einem Interpreter-Aufruf statt zwei getrennten Identify-Abfragen.
+        item_id = str(tree.tk.call("apply", _TCL_KLICK_ZEILE, str(tree), event.x, event.y))
+        if not item_id:
             return
 
+        spaltenname, attribut = treffer
         zeile = self._zeilen_nach_id[item_id]
-        attribut = _ROLLEN_SPALTEN[spaltenname]
         neuer_wert = not getattr(zeile, attribut)
         setattr(zeile, attribut, neuer_wert)
         if zeile.auto_rolle:
             zeile.manuell_ueberschrieben = True
-        self.tree.set(item_id, spaltenname, _checkbox_wert(neuer_wert))
+        self._verwerfe_serialisierung((item_id,))
+        self.tree.set(item_id, spaltenname, _CHECKBOX[neuer_wert])
 
     def server_manuell_hinzufuegen(self) -> None:
         servername = self.entry_servername.get().strip()
@@ -1225,12 +1573,13 @@ class MehrserverAnalyseGUI:
     def _parse_discovery_range_zeile(self, zeile: str) -> DiscoveryRangeSegment:
         """Parst eine einzelne Range-Zeile im Format `A.B.C.X-Y`."""
         text = zeile.strip()
-        hostteil, endteil = text.rsplit("-", maxsplit=1)
+        hostteil, trenner, endteil = text.rpartition("-")
         oktette = hostteil.split(".")
-        if len(oktette) != 4 or not all(teil.isdigit() for teil in oktette):
+        # isdigit() fängt offensichtliche Fehleingaben ab, bevor int() eine Exception erzeugen kann.
+        if not trenner or len(oktette) != 4 or not endteil.isdigit() or not all(teil.isdigit() for teil in oktette):
             raise ValueError(f"Ungültiges Range-Format: {text}")
-        basis = ".".join(oktette[:3])
-        if not _IPV4_BASIS_REGEX.fullmatch(basis):
+        basis = hostteil.rpartition(".")[0]
+        if not _ist_gueltige_ipv4_basis(basis):
             raise ValueError(f"Ungültige IPv4-Basis in Segment: {text}")
 
         startwert = int(oktette[3])
@@ -1244,22 +1593,25 @@ class MehrserverAnalyseGUI:
 
     def _validiere_discovery_eingaben(self) -> tuple[list[DiscoveryRangeSegment], list[str], bool] | None:
         """Validiert Discovery-Ranges und optionale Seeds aus den Mehrzeilenfeldern."""
-        self._discovery_validierung_hinweis_var.set("")
-        range_text = self.text_discovery_ranges.get("1.0", "end").strip()
-        seed_text = self.text_discovery_seeds.get("1.0", "end").strip()
+        hinweis_var = self._discovery_validierung_hinweis_var
+        hinweis_var.set("")
+        range_text = self.text_discovery_ranges.get("1.0", "end")
+        seed_text = self.text_discovery_seeds.get("1.0", "end")
 
-        range_zeilen = [zeile.strip() for zeile in range_text.splitlines() if zeile.strip()]
-        if not range_zeilen:
-            self._discovery_validierung_hinweis_var.set("Bitte mindestens ein Discovery-Segment eintragen (z. B. 192.168.178.1-30).")
+        def _fehler(text: str) -> None:
+            hinweis_var.set(text)
             return None
 
+        range_zeilen = [zeile for zeile in (roh.strip() for roh in range_text.splitlines()) if zeile]
+        if not range_zeilen:
+            return _fehler("Bitte mindestens ein Discovery-Segment eintragen (z. B. 192.168.178.1-30).")
+
         try:
             ranges = [self._parse_discovery_range_zeile(zeile) for zeile in range_zeilen]
         except ValueError as exc:
-            self._discovery_validierung_hinweis_var.set(str(exc))
-            return None
+            return _fehler(str(exc))
 
-        seeds = [zeile.strip() for zeile in seed_text.splitlines() if zeile.strip()]
+        seeds = [zeile for zeile in (roh.strip() for roh in seed_text.splitlines()) if zeile]
         self._discovery_range_text_var.set("\n".join(range_zeilen))
         self._discovery_seed_text_var.set("\n".join(seeds))
         return ranges, seeds, self._discovery_ad_seeds_var.get()
@@ -1283,32 +1635,58 @@ class MehrserverAnalyseGUI:
         self._letzte_discovery_range.set(", ".join(segment.als_text() for segment in ranges))
         self.shell.setze_status("Netzwerkerkennung läuft")
         gesamt = sum(max(0, segment.ende - segment.start + 1) for segment in ranges)
+        cache_ttl_s = float(getattr(self, "modulzustand", {}).get("discovery_cache_ttl_s", _DISCOVERY_CACHE_TTL_S))
+        executor = self._hole_executor()
 
         def worker(ereignisse: queue.Queue[tuple[str, object]], abbruch_event: threading.Event) -> None:
             konfiguration = DiscoveryKonfiguration(nutze_reverse_dns=True, nutze_ad_ldap=nutze_ad_seeds)
-            range_treffer: list[DiscoveryErgebnis] = []
+            hosts = [(segment.basis, host) for segment in ranges for host in range(segment.start, segment.ende + 1)]
+            treffer_pro_host: list[list[DiscoveryErgebnis]] = [[] for _ in hosts]
             verarbeitet = 0
             fehler = 0
-            for segment in ranges:
-                for host in range(segment.start, segment.ende + 1):
-                    if abbruch_event.is_set():
-                        ereignisse.put(("abgeschlossen", {"abgebrochen": True, "range_treffer": range_treffer, "verarbeitet": verarbeitet, "fehler": fehler}))
-                        return
-                    startzeit = time.perf_counter()
-                    try:
-                        range_treffer.extend(
-                            entdecke_server_ergebnisse(
-                                basis=segment.basis,
-                                start=host,
-                                ende=host,
-                                konfiguration=konfiguration,
-                            )
-                        )
-                    except Exception:
-                        fehler += 1
-                        logger.exception("Discovery fehlgeschlagen für %s.%s", segment.basis, host)
-                    verarbeitet += 1
-                    ereignisse.put(("fortschritt", {"verarbeitet": verarbeitet, "dauer": time.perf_counter() - startzeit}))
+            gefunden = 0
+            abgebrochen = False
+
+            def _pruefe_host(basis: str, host: int) -> list[DiscoveryErgebnis]:
+                # Wiederholte Scans desselben Bereichs (auch ohne Treffer) werden aus dem Cache bedient,
+                # gleichzeitige Abfragen desselben Hosts teilen sich eine laufende Ermittlung.
+                return _DISCOVERY_CACHE.hole_oder_ermittle(
+                    (basis, host, konfiguration.nutze_reverse_dns, konfiguration.nutze_ad_ldap),
+                    cache_ttl_s,
+                    lambda: entdecke_server_ergebnisse(basis=basis, start=host, ende=host, konfiguration=konfiguration),
+                )
+
+            # Die Hosts sind latenzgebunden (Ping, TCP, Reverse-DNS); parallele Abfragen verkürzen den Lauf
+            # von der Summe auf etwa das Maximum der Einzellaufzeiten je Worker-Welle.
+            futures: dict[Future[list[DiscoveryErgebnis]], int] = {
+                executor.submit(_pruefe_host, basis, host): index
+                for index, (basis, host) in enumerate(hosts)
+            }
+            # Die ETA basiert auf dem Abstand zwischen Abschlüssen, da Hosts parallel laufen.
+            letzter_abschluss = time.perf_counter()
+            for future in as_completed(futures):
+                if abbruch_event.is_set():
+                    abgebrochen = True
+                    for offen in futures:
+                        offen.cancel()
+                    break
+                index = futures[future]
+                try:
+                    treffer_pro_host[index] = future.result()
+                    gefunden += len(treffer_pro_host[index])
+                except Exception:
+                    fehler += 1
+                    logger.exception("Discovery fehlgeschlagen für %s.%s", *hosts[index])
+                verarbeitet += 1
+                jetzt = time.perf_counter()
+                ereignisse.put(("fortschritt", {"verarbeitet": verarbeitet, "dauer": jetzt - letzter_abschluss, "treffer": gefunden}))
+                letzter_abschluss = jetzt
+
+            # Reihenfolge der Treffer bleibt unabhängig von der Abschlussreihenfolge stabil (Range-Reihenfolge).
+            range_treffer = [item for treffer in treffer_pro_host for item in treffer]
+            if abgebrochen:
+                ereignisse.put(("abgeschlossen", {"abgebrochen": True, "range_treffer": range_treffer, "verarbeitet": verarbeitet, "fehler": fehler}))
+                return
 
             seed_treffer = entdecke_server_via_seeds(seeds=seeds, konfiguration=konfiguration) if (seeds or nutze_ad_seeds) else []
             ereignisse.put(("abgeschlossen", {"abgebrochen": False, "range_treffer": range_treffer, "seed_treffer": seed_treffer, "verarbeitet": verarbeitet, "fehler": fehler}))
@@ -1348,8 +1726,17 @@ class MehrserverAnalyseGUI:
             self.shell.setze_status("Netzwerkerkennung beendet: Fehler")
             self._aktualisiere_button_zustaende()
 
-        self._starte_hintergrundlauf(gesamt=gesamt, worker=worker, bei_erfolg=erfolg, bei_fehler=fehler)
+        def fortschritt(daten: dict[str, object]) -> None:
+            # Laufende Trefferzahl sichtbar machen, bevor der Auswahldialog am Ende alle Treffer zeigt.
+            self.shell.setze_status(f"Netzwerkerkennung läuft: {int(daten.get('treffer', 0) or 0)} Treffer bisher")
 
+        self._starte_hintergrundlauf(gesamt=gesamt, worker=worker, bei_erfolg=erfolg, bei_fehler=fehler, bei_fortschritt=fortschritt)
+
+    def discovery_cache_leeren(self) -> None:
+        """Verwirft zwischengespeicherte Discovery-Treffer, damit neu erreichbare Hosts sofort erkannt werden."""
+        _DISCOVERY_CACHE.leere()
+        self.shell.setze_status("Erkennungs-Cache geleert")
+        self.shell.logge_meldung("Zwischengespeicherte Discovery-Treffer wurden verworfen; der nächste Lauf prüft alle Hosts neu.")
 
     def _lese_discovery_namen_aus_textfeld(self) -> list[str]:
         """Liest die Namenliste robust aus dem Mehrzeilenfeld und entfernt Leerzeilen."""
@@ -1373,46 +1760,58 @@ class MehrserverAnalyseGUI:
 
         self._letzter_discovery_modus.set("namenliste")
         self.shell.setze_status("Servernamenprüfung läuft")
-        self.master.update_idletasks()
+        konfiguration = DiscoveryKonfiguration(
+            nutze_reverse_dns=True,
+            nutze_ad_ldap=self._discovery_ad_seeds_var.get(),
+        )
 
-        try:
-            treffer = entdecke_server_namen(
-                hosts=hosts,
-                konfiguration=DiscoveryKonfiguration(
-                    nutze_reverse_dns=True,
-                    nutze_ad_ldap=self._discovery_ad_seeds_var.get(),
-                ),
-            )
-        except Exception as exc:  # noqa: BLE001 - robuste GUI-Fehlerbehandlung.
-            logger.exception("Servernamenprüfung fehlgeschlagen")
+        def worker(ereignisse: queue.Queue[tuple[str, object]], abbruch_event: threading.Event) -> None:
+            if abbruch_event.is_set():
+                ereignisse.put(("abgeschlossen", {"abgebrochen": True, "treffer": []}))
+                return
+            startzeit = time.perf_counter()
+            treffer = entdecke_server_namen(hosts=hosts, konfiguration=konfiguration)
+            ereignisse.put(("fortschritt", {"verarbeitet": len(hosts), "dauer": time.perf_counter() - startzeit}))
+            ereignisse.put(("abgeschlossen", {"abgebrochen": False, "treffer": treffer}))
+
+        def erfolg(daten: object) -> None:
+            payload = daten if isinstance(daten, dict) else {}
+            treffer = payload.get("treffer", []) if isinstance(payload.get("treffer", []), list) else []
+            if payload.get("abgebrochen"):
+                self.shell.setze_status("Servernamenprüfung abgebrochen")
+                self._aktualisiere_button_zustaende()
+                return
+            self._uebernehme_discovery_treffer(treffer, erfolgstitel="Servernamenprüfung abgeschlossen")
+            self.shell.setze_status("Servernamenprüfung abgeschlossen")
+            self._aktualisiere_button_zustaende()
+
+        def fehler(exc: Exception) -> None:
+            logger.error("Servernamenprüfung fehlgeschlagen", exc_info=exc)
             self.shell.zeige_fehler("Fehler bei der Servernamenprüfung", f"Die Prüfung konnte nicht ausgeführt werden: {exc}", "Prüfen Sie Namensauflösung und Berechtigungen.")
             self.shell.setze_status("Servernamenprüfung fehlgeschlagen")
-            return
+            self._aktualisiere_button_zustaende()
 
-        self._uebernehme_discovery_treffer(treffer, erfolgstitel="Servernamenprüfung abgeschlossen")
-        self.shell.setze_status("Servernamenprüfung abgeschlossen")
-        self._aktualisiere_button_zustaende()
+        self._starte_hintergrundlauf(gesamt=len(hosts), worker=worker, bei_erfolg=erfolg, bei_fehler=fehler)
 
     def _uebernehme_discovery_treffer(self, treffer: list[DiscoveryErgebnis], *, erfolgstitel: str) -> None:
         """Zeigt Treffer im Standarddialog und übernimmt ausgewählte Server in die Tabelle."""
         dialog = DiscoveryTrefferDialog(self.master, treffer)
         self.master.wait_window(dialog.window)
 
-        hinzugefuegt = 0
+        neue_zeilen: list[ServerTabellenZeile] = []
         for auswahl in dialog.ausgewaehlt:
-            vorher = len(self._zeilen_nach_id)
             auto_rollen = _rollen_aus_discovery_treffer(auswahl)
-            auto_rolle = ", ".join(auto_rollen)
-            self._fuege_zeile_ein(
+            rollen_menge = frozenset(auto_rollen)
+            neue_zeilen.append(
                 ServerTabellenZeile(
                     servername=auswahl.hostname,
                     quelle="Discovery",
                     status="bereit",
-                    sql="SQL" in auto_rollen,
-                    app="APP" in auto_rollen,
-                    ctx="CTX" in auto_rollen,
-                    dc="DC" in auto_rollen,
-                    auto_rolle=auto_rolle,
+                    sql="SQL" in rollen_menge,
+                    app="APP" in rollen_menge,
+                    ctx="CTX" in rollen_menge,
+                    dc="DC" in rollen_menge,
+                    auto_rolle=", ".join(auto_rollen),
                     namensquelle=auswahl.namensquelle or "nicht auflösbar",
                     erreichbarkeitsstatus="erreichbar" if auswahl.erreichbar else "nicht erreichbar",
                     vertrauensgrad=auswahl.vertrauensgrad,
@@ -1420,8 +1819,7 @@ class MehrserverAnalyseGUI:
                     rollenhinweise=auswahl.rollenhinweise,
                 )
             )
-            if len(self._zeilen_nach_id) > vorher:
-                hinzugefuegt += 1
+        hinzugefuegt = self._fuege_zeilen_ein(neue_zeilen)
 
         self.shell.zeige_erfolg(
             erfolgstitel,
@@ -1435,36 +1833,75 @@ class MehrserverAnalyseGUI:
             return
 
         for item_id in auswahl:
-            self._zeilen_nach_id.pop(item_id, None)
-            self.tree.delete(item_id)
+            zeile = self._zeilen_nach_id.pop(item_id, None)
+            if zeile is not None:
+                self._id_nach_norm_name.pop(zeile.name_norm, None)
+        # Ein einziger Tcl-Aufruf entfernt die gesamte Auswahl.
+        self.tree.delete(*auswahl)
+        self._verwerfe_serialisierung(auswahl)
         self.shell.setze_status("Ausgewählte Einträge gelöscht")
         self._aktualisiere_button_zustaende()
 
     def _zeige_ergebnisse_aufklappbar(self, ergebnisse: list[AnalyseErgebnis]) -> None:
         """Aktualisiert Management-Zusammenfassung und Tab-basierte Detailkarten."""
         self.lbl_executive_summary.configure(text="\n".join(_baue_executive_summary(ergebnisse)))
-        self._detailkarten = baue_server_detailkarten(ergebnisse)
+        self._ergebnis_nach_server = {ergebnis.server: ergebnis for ergebnis in ergebnisse}
+        self._detailkarten = {}
 
-        servernamen = [karte.server for karte in self._detailkarten]
+        servernamen = list(self._ergebnis_nach_server)
         self.cmb_serverauswahl.configure(values=servernamen)
         if servernamen:
             self._server_auswahl_var.set(servernamen[0])
         self._aktualisiere_tab_inhalte()
 
     def _setze_server_status(self, status: str) -> None:
+        """Setzt den Status aller Zeilen; nur geänderte Zeilen gehen in einem einzigen Tcl-Aufruf an die Tabelle."""
+        item_ids = []
         for item_id, zeile in self._zeilen_nach_id.items():
-            zeile.status = status
-            self.tree.set(item_id, _SPALTE_STATUS, status)
+            if zeile.status != status:
+                zeile.status = status
+                item_ids.append(item_id)
+        self._verwerfe_serialisierung(item_ids)
+        self._setze_spaltenwert_fuer_alle(tuple(item_ids), _SPALTE_STATUS, status)
+
+    def _setze_status_fuer_server(self, servername: str, status: str) -> None:
+        """Setzt den Status der Tabellenzeile eines Servers."""
+        item_id = self._id_nach_norm_name.get(normalisiere_servernamen(servername))
+        zeile = self._zeilen_nach_id.get(item_id) if item_id is not None else None
+        if zeile is None or zeile.status == status:
+            return
+        zeile.status = status
+        self._verwerfe_serialisierung((item_id,))
+        self._setze_spaltenwert_fuer_alle((item_id,), _SPALTE_STATUS, status)
+
+    def _verwerfe_serialisierung(self, item_ids: Sequence[str]) -> None:
+        """Markiert Zeilen als geändert, damit `speichern` sie neu serialisiert."""
+        cache = getattr(self, "_serialisiert_nach_id", None)
+        if cache:
+            for item_id in item_ids:
+                cache.pop(item_id, None)
+
+    def _setze_spaltenwert_fuer_alle(self, item_ids: tuple[str, ...], spalte: str, wert: str) -> None:
+        """Setzt eine Spalte für viele Zeilen mit einem einzigen Tcl-Aufruf statt einem Aufruf je Zeile."""
+        if not item_ids:
+            return
+        # Argumente werden von tkinter als Tcl-Werte übergeben, daher ist kein manuelles Quoting nötig.
+        self.tree.tk.call("apply", _TCL_SETZE_SPALTE, str(self.tree), item_ids, spalte, wert)
 
     def analyse_starten(self) -> None:
         """Startet die Analyse im Hintergrund und zeigt standardisierte Endstatus an."""
-        zeilen = list(self._zeilen_nach_id.values())
+        zeilen = self._rows()
         ziele = _baue_serverziele(zeilen)
         if not ziele:
             self.shell.zeige_warnung("Keine Server", "Bitte mindestens einen gültigen Server hinzufügen.", "Fügen Sie mindestens einen Server in der Liste hinzu.")
             return
 
-        bestaetigt = self.shell.bestaetige_aktion("Analyse bestätigen", _deklarationszusammenfassung(ziele, zeilen))
+        # Der Namensindex liefert die normalisierten Schlüssel bereits; Zeilen müssen nicht erneut normalisiert werden.
+        zeilen_nach_id = self._zeilen_nach_id
+        quelle_pro_server = {name_norm: zeilen_nach_id[item_id].quelle for name_norm, item_id in self._id_nach_norm_name.items()}
+        bestaetigt = self.shell.bestaetige_aktion(
+            "Analyse bestätigen", _deklarationszusammenfassung(ziele, zeilen, quelle_pro_server=quelle_pro_server)
+        )
         if not bestaetigt:
             return
 
@@ -1474,23 +1911,77 @@ class MehrserverAnalyseGUI:
         self._setze_server_status("Analyse läuft")
         self.shell.setze_status("Analyse läuft")
 
+        # Tk-Variablen und Zeilen nur im GUI-Thread lesen; der Worker erhält Pfad und Anmerkungen als Kopie,
+        # da die Zeilenobjekte während des Laufs weiter bearbeitet werden können.
+        report_pfad = self._ausgabe_pfad.get().strip() or "docs/serverbericht.md"
+        anmerkungen_pro_server = _mappe_manuelle_anmerkungen(zeilen)
+        memo_schluessel = _analyse_memo_schluessel(ziele)
+        memo_treffer = self._lese_analyse_memo(memo_schluessel)
+        cache_hinweis = _analyse_cache_hinweis(memo_treffer) if memo_treffer is not None else None
+        executor = self._hole_executor()
+
         def worker(ereignisse: queue.Queue[tuple[str, object]], abbruch_event: threading.Event) -> None:
             ergebnisse: list[AnalyseErgebnis] = []
             verarbeitet = 0
             fehler = 0
-            for ziel in ziele:
-                if abbruch_event.is_set():
-                    ereignisse.put(("abgeschlossen", {"abgebrochen": True, "ergebnisse": ergebnisse, "verarbeitet": verarbeitet, "fehler": fehler}))
-                    return
-                startzeit = time.perf_counter()
-                try:
-                    ergebnisse.extend(analysiere_mehrere_server([ziel], lauf_id=lauf_id))
-                except Exception:
-                    fehler += 1
-                    logger.exception("Mehrserveranalyse für %s fehlgeschlagen", ziel.name)
-                verarbeitet += 1
-                ereignisse.put(("fortschritt", {"verarbeitet": verarbeitet, "dauer": time.perf_counter() - startzeit}))
-            ereignisse.put(("abgeschlossen", {"abgebrochen": False, "ergebnisse": ergebnisse, "verarbeitet": verarbeitet, "fehler": fehler}))
+            abgebrochen = False
+            if memo_treffer is not None:
+                # Unveränderte Zielmenge kurz nach dem letzten Lauf: Rohergebnisse kopieren statt erneut zu analysieren.
+                ergebnisse = copy.deepcopy(memo_treffer)
+                for ergebnis in ergebnisse:
+                    ergebnis.lauf_id = lauf_id
+                verarbeitet = len(ziele)
+                ereignisse.put(("fortschritt", {"verarbeitet": verarbeitet, "dauer": 0.0}))
+            else:
+                # Server parallel analysieren (höchstens `_ANALYSE_PARALLELITAET` gleichzeitig) und jeden Abschluss
+                # sofort melden; die Ergebnisreihenfolge folgt danach wieder der Tabellenreihenfolge.
+                ergebnisse_pro_ziel: list[list[AnalyseErgebnis]] = [[] for _ in ziele]
+                warteschlange = iter(enumerate(ziele))
+                laufend: dict[Future[list[AnalyseErgebnis]], int] = {}
+
+                def _nachlegen() -> None:
+                    for index, ziel in islice(warteschlange, _ANALYSE_PARALLELITAET - len(laufend)):
+                        laufend[executor.submit(analysiere_mehrere_server, [ziel], lauf_id=lauf_id)] = index
+
+                _nachlegen()
+                letzter_abschluss = time.perf_counter()
+                while laufend:
+                    fertig, _ = wait(laufend, return_when=FIRST_COMPLETED)
+                    if abbruch_event.is_set():
+                        abgebrochen = True
+                        for offen in laufend:
+                            offen.cancel()
+                        break
+                    for future in fertig:
+                        index = laufend.pop(future)
+                        meldung: dict[str, object] = {}
+                        try:
+                            ergebnisse_pro_ziel[index] = future.result()
+                            meldung["server"] = ziele[index].name
+                        except Exception:
+                            fehler += 1
+                            logger.exception("Mehrserveranalyse für %s fehlgeschlagen", ziele[index].name)
+                        verarbeitet += 1
+                        jetzt = time.perf_counter()
+                        meldung.update(verarbeitet=verarbeitet, dauer=jetzt - letzter_abschluss)
+                        ereignisse.put(("fortschritt", meldung))
+                        letzter_abschluss = jetzt
+                    _nachlegen()
+                ergebnisse = [ergebnis for teil in ergebnisse_pro_ziel for ergebnis in teil]
+
+            # Anmerkungen übernehmen und Bericht rendern/schreiben, solange wir noch im Worker-Thread sind,
+            # damit große Berichte die Tk-Ereignisschleife nicht blockieren.
+            payload: dict[str, object] = {"abgebrochen": abgebrochen, "verarbeitet": verarbeitet, "fehler": fehler}
+            if memo_treffer is None and not abgebrochen and not fehler:
+                payload["memo"] = copy.deepcopy(ergebnisse)
+            _wende_manuelle_anmerkungen_an(ergebnisse, anmerkungen_pro_server)
+            payload["ergebnisse"] = ergebnisse
+            try:
+                payload["export"] = _schreibe_analyse_report(ergebnisse, report_pfad, quelle=cache_hinweis)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Analysebericht konnte nicht geschrieben werden")
+                payload["export_fehler"] = exc
+            ereignisse.put(("abgeschlossen", payload))
 
         def erfolg(daten: object) -> None:
             payload = daten if isinstance(daten, dict) else {}
@@ -1498,21 +1989,35 @@ class MehrserverAnalyseGUI:
             verarbeitet = int(payload.get("verarbeitet", 0) or 0)
             fehler = int(payload.get("fehler", 0) or 0)
             abgebrochen = bool(payload.get("abgebrochen", False))
+            quelle = cache_hinweis or "Analyse"
+            if isinstance(payload.get("memo"), list):
+                self._analyse_memo = {memo_schluessel: (time.monotonic(), payload["memo"])}
 
             self._letzte_ergebnisse = ergebnisse
-            _integriere_manuelle_anmerkungen(ergebnisse, zeilen)
             self._server_summary = _baue_server_summary(ergebnisse)
-            status_nach_server = {normalisiere_servernamen(ergebnis.server): "analysiert" for ergebnis in ergebnisse}
-            for item_id, zeile in self._zeilen_nach_id.items():
-                zeile.status = status_nach_server.get(normalisiere_servernamen(zeile.servername), "nicht analysiert")
-                self.tree.set(item_id, _SPALTE_STATUS, zeile.status)
+            analysierte_server = {normalisiere_servernamen(ergebnis.server) for ergebnis in ergebnisse}
+            # Nur geänderte Zeilen aktualisieren, gruppiert nach neuem Status für je einen Tcl-Aufruf.
+            # Zeilenschleife über den Namensindex, damit je Zeile keine erneute Normalisierung nötig ist.
+            geaendert: dict[str, list[str]] = {}
+            zeilen_nach_id = self._zeilen_nach_id
+            gruppe_fuer = geaendert.setdefault
+            for name_norm, item_id in self._id_nach_norm_name.items():
+                zeile = zeilen_nach_id[item_id]
+                neuer_status = "analysiert" if name_norm in analysierte_server else "nicht analysiert"
+                if neuer_status != zeile.status:
+                    zeile.status = neuer_status
+                    gruppe_fuer(neuer_status, []).append(item_id)
+            spalte_status = _SPALTE_STATUS
+            for neuer_status, item_ids in geaendert.items():
+                self._verwerfe_serialisierung(item_ids)
+                self._setze_spaltenwert_fuer_alle(tuple(item_ids), spalte_status, neuer_status)
 
             if ergebnisse:
                 self._zeige_ergebnisse_aufklappbar(ergebnisse)
 
-            report_pfad = self._ausgabe_pfad.get().strip() or "docs/serverbericht.md"
-            try:
-                export_pfad, export_zeitpunkt = _schreibe_analyse_report(ergebnisse, report_pfad)
+            export = payload.get("export")
+            if isinstance(export, tuple):
+                export_pfad, export_zeitpunkt = export
                 self._letzter_export_pfad = export_pfad
                 self._letzter_exportzeitpunkt = export_zeitpunkt
                 self._letzte_export_lauf_id = lauf_id
@@ -1520,8 +2025,8 @@ class MehrserverAnalyseGUI:
                     _baue_report_verweistext(self._letzter_export_pfad, self._letzter_exportzeitpunkt, self._letzte_export_lauf_id)
                 )
                 self.shell.logge_meldung(f"Analysebericht erstellt: {export_pfad}")
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("Analysebericht konnte nicht geschrieben werden")
+            else:
+                exc = payload.get("export_fehler")
                 self.shell.zeige_warnung(
                     "Exportwarnung",
                     f"Analyse war erfolgreich, aber der Bericht konnte nicht geschrieben werden: {exc}",
@@ -1535,8 +2040,9 @@ class MehrserverAnalyseGUI:
             if status == "Fehler":
                 self._setze_server_status("fehlerhaft")
             self.shell.setze_status(f"Analyse beendet: {status}")
-            self.shell.logge_meldung(f"Analyse Status: {status} | Verarbeitet {verarbeitet}/{len(ziele)} | Fehlerläufe: {fehler} | Lauf-ID: {lauf_id}")
-            self.speichern()
+            self.shell.logge_meldung(f"Analyse Status: {status} | Verarbeitet {verarbeitet}/{len(ziele)} | Fehlerläufe: {fehler} | Quelle: {quelle} | Lauf-ID: {lauf_id}")
+            # Ergebnisse zuerst zeichnen lassen; gespeichert wird, sobald Tk wieder im Leerlauf ist.
+            self.master.after_idle(lambda: self.speichern(nur_bei_aenderung=True))
             if status == "Erfolg":
                 self.shell.zeige_erfolg("Analyse abgeschlossen", "Die Mehrserveranalyse wurde erfolgreich abgeschlossen.", "Öffnen Sie die Ergebnisdetails oder starten Sie den nächsten Lauf.")
             elif status == "Teil-Erfolg":
@@ -1544,14 +2050,39 @@ class MehrserverAnalyseGUI:
             else:
                 self.shell.zeige_fehler("Analyse fehlgeschlagen", "Kein Server konnte erfolgreich analysiert werden.", "Prüfen Sie Konnektivität, Rechte und Logs.")
 
+        def fortschritt(payload: dict[str, object]) -> None:
+            # Fertige Server schon während des Laufs als analysiert markieren statt erst nach dem langsamsten Server.
+            server = payload.get("server")
+            if isinstance(server, str):
+                self._setze_status_fuer_server(server, "analysiert")
+
         def fehler(exc: Exception) -> None:
             logger.exception("Mehrserveranalyse fehlgeschlagen")
             self.shell.zeige_fehler("Analysefehler", f"Mehrserveranalyse fehlgeschlagen: {exc}", "Prüfen Sie die Logs und wiederholen Sie die Analyse.")
             self._setze_server_status("fehlerhaft")
             self.shell.setze_status("Analyse beendet: Fehler")
 
-        self._starte_hintergrundlauf(gesamt=len(ziele), worker=worker, bei_erfolg=erfolg, bei_fehler=fehler)
+        self._starte_hintergrundlauf(gesamt=len(ziele), worker=worker, bei_erfolg=erfolg, bei_fehler=fehler, bei_fortschritt=fortschritt)
 
+    def analyse_cache_leeren(self) -> None:
+        """Verwirft gemerkte Analyseergebnisse, damit der nächste Lauf alle Server neu analysiert."""
+        self._analyse_memo.clear()
+        self.shell.setze_status("Analyse-Cache geleert")
+        self.shell.logge_meldung("Gemerkte Analyseergebnisse wurden verworfen; der nächste Lauf analysiert alle Server neu.")
+
+    def _lese_analyse_memo(self, schluessel: tuple[tuple[object, ...], ...]) -> list[AnalyseErgebnis] | None:
+        """Liefert noch gültige Rohergebnisse eines identischen Vorlaufs oder ``None``.
+
+        Passt der Vorlauf nicht (andere Ziele oder abgelaufen), wird das Memo geleert, damit dessen
+        Ergebnisgraph nicht bis zum nächsten vollständigen Lauf im Speicher gehalten wird.
+        """
+        memo = self._analyse_memo
+        eintrag = memo.get(schluessel)
+        ttl_s = float(self.modulzustand.get("analyse_cache_ttl_s", _ANALYSE_MEMO_TTL_S))
+        if eintrag is None or time.monotonic() - eintrag[0] > ttl_s:
+            memo.clear()
+            return None
+        return eintrag[1]
 
     def _baue_kerninfos(self) -> list[str]:
         """Erzeugt kompakte Übersichtsinfos für die Übersichtsseite im Launcher."""
@@ -1590,8 +2121,18 @@ class MehrserverAnalyseGUI:
         letzte_discovery_namen = (letzte_discovery_namen or "").strip()
         self._letzte_discovery_namen.set(letzte_discovery_namen)
 
-        serverlisten = [asdict(zeile) for zeile in self._zeilen_nach_id.values()]
-        rollen = {zeile.servername: zeile.rollen() for zeile in self._zeilen_nach_id.values()}
+        # Ein Durchlauf über alle Zeilen liefert Serverliste und Rollenzuordnung gemeinsam.
+        serverlisten: list[dict[str, object]] = []
+        rollen: dict[str, list[str]] = {}
+        # Unveränderte Zeilen kommen aus dem Cache; `asdict` beim Persistieren kopiert die Einträge ohnehin tief.
+        serialisiere = _serialisiere_zeile
+        cache = self._serialisiert_nach_id
+        for item_id, zeile in self._zeilen_nach_id.items():
+            eintrag = cache.get(item_id)
+            if eintrag is None:
+                eintrag = cache[item_id] = (serialisiere(zeile), zeile.rollen())
+            serverlisten.append(eintrag[0])
+            rollen[zeile.servername] = eintrag[1]
 
         aufgeloeste_range = (discovery_range or self._letzte_discovery_range.get() or "").strip()
         aufgeloester_modus = (discovery_modus or self._letzter_discovery_modus.get() or "range").strip() or "range"
@@ -1625,23 +2166,34 @@ class MehrserverAnalyseGUI:
             letzte_export_lauf_id=self._letzte_export_lauf_id,
         )
 
-    def speichern(self, daten: ServerAnalysePersistenzDaten | None = None) -> None:
+    def speichern(self, daten: ServerAnalysePersistenzDaten | None = None, *, nur_bei_aenderung: bool = False) -> None:
         """Persistiert Serverlisten, Rollen, Discovery-Range und Ausgabepfade.
 
         Optional kann ein vorbereitetes Datenobjekt übergeben werden, damit die
         Persistenz auch in Nicht-GUI-Kontexten robust genutzt werden kann.
+        Mit ``nur_bei_aenderung`` wird das Schreiben übersprungen, wenn sich der
+        Stand seit der letzten Speicherung nicht geändert hat.
         """
         persistenzdaten = daten or self._baue_persistenzdaten()
+        # Der Fingerabdruck wird nur für bedingte Speicherungen gebraucht; explizites Speichern schreibt immer
+        # und verwirft den alten Fingerabdruck, damit die nächste bedingte Speicherung sicher schreibt.
+        persistenz_hash = None
+        if nur_bei_aenderung:
+            persistenz_hash = hash(json.dumps(asdict(persistenzdaten), sort_keys=True, default=str))
+            if persistenz_hash == getattr(self, "_letzter_persistenz_hash", None):
+                logger.debug("Persistenzstand unverändert, Speichern übersprungen.")
+                return
         self.modulzustand = persistiere_serveranalyse_zustand(
             state_store=self.state_store,
             modulzustand=self.modulzustand,
             daten=persistenzdaten,
             shell=self.shell,
         )
+        self._letzter_persistenz_hash = persistenz_hash
 
     def _zurueck(self) -> None:
-        """Navigationsaktion: in dieser Ansicht entspricht Zurück dem Schließen."""
-        self.master.destroy()
+        """Navigationsaktion: in dieser Ansicht entspricht Zurück dem Schließen (inkl. Schutz laufender Jobs)."""
+        self._on_close()
 
 
 def start_gui() -> None:
@@ -13,9 +13,11 @@ from __future__ import annotations
 
 import argparse
 import logging
+import logging.handlers
 import os
 import warnings
 from dataclasses import asdict
+from functools import cache
 
 from systemmanager_sagehelper.analyzer import analysiere_mehrere_server
 from systemmanager_sagehelper.models import ServerZiel
@@ -25,16 +27,32 @@ LEGACY_HINWEIS = (
     "Verwenden Sie stattdessen `server_analysis_gui.py` oder `python -m systemmanager_sagehelper`."
 )
 
-logging.basicConfig(
-    filename=os.path.join(os.getcwd(), "logs/server_roles_analysis.log"),
-    level=logging.WARNING,
-    format="[%(asctime)s] %(message)s",
-)
+
+@cache
+def _konfiguriere_logging() -> None:
+    """Richtet das Legacy-Log erst bei der ersten Nutzung ein statt beim Import.
+
+    Meldungen werden gepuffert und spätestens bei Fehlern oder Prozessende in die Datei geschrieben.
+    """
+    datei_handler = logging.FileHandler(os.path.join(os.getcwd(), "logs/server_roles_analysis.log"), delay=True)
+    datei_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+    logging.basicConfig(
+        level=logging.WARNING,
+        handlers=[logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=datei_handler)],
+    )
+
+
+@cache
+def _protokolliere_legacy_hinweis() -> None:
+    """Schreibt den Legacy-Hinweis einmal pro Prozess ins Log."""
+    _konfiguriere_logging()
+    logging.warning(LEGACY_HINWEIS)
 
 
 def _protokolliere_und_warne_deprecation() -> None:
     """Gibt einen einheitlichen Deprecation-Hinweis auf Konsole und im Log aus."""
-    logging.warning(LEGACY_HINWEIS)
+    _protokolliere_legacy_hinweis()
+    # Die Warnung bleibt je Aufruf bestehen; Wiederholungen unterdrückt bereits der Warnungsfilter.
     warnings.warn(LEGACY_HINWEIS, category=DeprecationWarning, stacklevel=2)
 
 
@@ -4,6 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 
+# Port-Tokens je Rolle; einmalig als frozenset angelegt statt je Aufruf neu gebaut.
+_SQL_PORTS = frozenset({"1433", "1434", "4022"})
+_DC_PORTS = frozenset({"53", "88", "389", "445", "464", "636", "3268", "3269"})
+_DC_HINWEIS_TOKENS = ("netlogon", "kdc", "ldap", "kerberos", "dns")
+
 
 def ableite_rollen_aus_discoveryindikatoren(
     *,
@@ -20,12 +25,12 @@ def ableite_rollen_aus_discoveryindikatoren(
     punktestand = {"SQL": 0, "APP": 0, "CTX": 0, "DC": 0}
 
     # Port-/Dienstgewichtung: SQL bleibt auch ohne offenen 1433 möglich.
-    erkannte_porttokens = {token.strip() for token in erkannte_dienste if token.strip().isdigit()}
-    if erkannte_porttokens & {"1433", "1434", "4022"}:
+    erkannte_porttokens = {token for token in (roh.strip() for roh in erkannte_dienste) if token.isdigit()}
+    if not _SQL_PORTS.isdisjoint(erkannte_porttokens):
         punktestand["SQL"] += 4
     if "3389" in erkannte_porttokens:
         punktestand["CTX"] += 4
-    if erkannte_porttokens & {"53", "88", "389", "445", "464", "636", "3268", "3269"}:
+    if not _DC_PORTS.isdisjoint(erkannte_porttokens):
         punktestand["DC"] += 4
 
     # Analysevorbefunde aus Discovery (z. B. Remote-Inventar, SQL-Dienste, Instanzen).
@@ -37,7 +42,7 @@ def ableite_rollen_aus_discoveryindikatoren(
             punktestand["DC"] += 3
         if "termservice" in lower or "sessionenv" in lower:
             punktestand["CTX"] += 2
-        if any(token in lower for token in ("netlogon", "kdc", "ldap", "kerberos", "dns")):
+        if any(token in lower for token in _DC_HINWEIS_TOKENS):
             punktestand["DC"] += 2
 
     # Restliche erreichbare Systeme werden als APP gewichtet, aber nicht blind bevorzugt.
@@ -7,6 +7,8 @@ beispielsweise Serverlisten, Rollen oder zuletzt genutzte Ausgabepfade.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
@@ -135,7 +137,26 @@ class GUIStateStore:
     def speichere_gesamtzustand(self, zustand: dict[str, Any]) -> None:
         """Persistiert den gesamten Zustand atomar in UTF-8."""
         self.dateipfad.parent.mkdir(parents=True, exist_ok=True)
-        self.dateipfad.write_text(json.dumps(zustand, ensure_ascii=False, indent=2), encoding="utf-8")
+        inhalt = json.dumps(zustand, ensure_ascii=False, indent=2)
+        # In eine Temporärdatei im Zielordner schreiben und erst danach umbenennen: ein Abbruch mitten im
+        # Schreiben hinterlässt so nie eine halb geschriebene Zustandsdatei.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.dateipfad.parent, prefix=f".{self.dateipfad.name}.", suffix=".tmp", delete=False
+        ) as datei:
+            temp_pfad = Path(datei.name)
+            try:
+                datei.write(inhalt)
+                datei.flush()
+                os.fsync(datei.fileno())
+            except BaseException:
+                datei.close()
+                temp_pfad.unlink(missing_ok=True)
+                raise
+        try:
+            os.replace(temp_pfad, self.dateipfad)
+        except OSError:
+            temp_pfad.unlink(missing_ok=True)
+            raise
 
     def lade_modulzustand(self, modulname: str) -> dict[str, Any]:
         """Liefert den Zustand eines Moduls inklusive Fallback auf Default-Struktur."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Literal
 
@@ -242,25 +243,26 @@ def _render_detailblock(ergebnis: AnalyseErgebnis) -> list[str]:
     return zeilen
 
 
-def render_markdown(
+def iter_markdown_abschnitte(
     ergebnisse: list[AnalyseErgebnis],
     *,
     kunde: str = "nicht angegeben",
     umgebung: str = "nicht angegeben",
     template_version: str = TEMPLATE_VERSION,
     berichtsmodus: Berichtsmodus = "voll",
-) -> str:
-    """Formatiert Analyseergebnisse in ein standardisiertes Markdown-Dokument.
+    quelle: str | None = None,
+) -> Iterator[str]:
+    """Liefert den Markdown-Bericht abschnittsweise (Kopf, je Server ein Detailblock, Abschluss).
 
-    Der Bericht unterstützt zwei Modi:
-    - ``voll``: Vollbericht mit technischen Detailblöcken je Server.
-    - ``kurz``: Kurzbericht für Management/Loop ohne tiefe technische Einzelwerte.
+    Die Abschnitte enden jeweils mit einem Zeilenumbruch; ``"".join(...)`` ergibt exakt
+    ``render_markdown(...)``. Große Berichte können so ohne Gesamtstring geschrieben werden.
+    Ist ``quelle`` gesetzt, erscheint sie als eigene Zeile im Kopfbereich (z. B. bei wiederverwendeten Ergebnissen).
     """
     erzeugt_am = datetime.now().isoformat(timespec="seconds")
     lauf_id = _ermittle_lauf_id(ergebnisse)
     modus_name = "Vollbericht technisch" if berichtsmodus == "voll" else "Kurzbericht für Loop"
 
-    zeilen: list[str] = [
+    kopf: list[str] = [
         f"# {BERICHT_TITEL}",
         "",
         f"## {BERICHT_KOPFBEREICH}",
@@ -268,6 +270,7 @@ def render_markdown(
         f"- Umgebung: {umgebung}",
         f"- Datum: {erzeugt_am}",
         f"- Lauf-ID: {lauf_id}",
+        *([f"- Quelle: {quelle}"] if quelle else []),
         f"- Berichtstyp: {modus_name}",
         f"- Zielgruppen: {ZIELGRUPPE_ADMIN}, {ZIELGRUPPE_SUPPORT}, {ZIELGRUPPE_DRITTUSER}",
         f"- Template-Version: {template_version}",
@@ -286,13 +289,47 @@ def render_markdown(
         *_baue_auswirkungen(ergebnisse),
         "",
     ]
+    if berichtsmodus == "voll":
+        kopf.extend(["## Detailblöcke je Server", ""])
+    yield "\n".join(kopf) + "\n"
 
     if berichtsmodus == "voll":
-        zeilen.append("## Detailblöcke je Server")
-        zeilen.append("")
         for ergebnis in ergebnisse:
-            zeilen.extend(_render_detailblock(ergebnis))
+            yield "\n".join(_render_detailblock(ergebnis)) + "\n"
+
+    # Die abschließende Leerzeile entfällt, wie beim früheren strip() des Gesamtstrings.
+    abschluss = [
+        f"## {BERICHT_MASSNAHMEN}",
+        *_baue_massnahmen(ergebnisse),
+        "",
+        f"## {BERICHT_ARTEFAKTE}",
+        "- Laufbezogene Artefakte sind im Dokumentationsbericht referenziert.",
+    ]
+    yield "\n".join(abschluss) + "\n"
+
+
+def render_markdown(
+    ergebnisse: list[AnalyseErgebnis],
+    *,
+    kunde: str = "nicht angegeben",
+    umgebung: str = "nicht angegeben",
+    template_version: str = TEMPLATE_VERSION,
+    berichtsmodus: Berichtsmodus = "voll",
+    quelle: str | None = None,
+) -> str:
+    """Formatiert Analyseergebnisse in ein standardisiertes Markdown-Dokument.
 
-    zeilen.extend([f"## {BERICHT_MASSNAHMEN}", *_baue_massnahmen(ergebnisse), ""])
-    zeilen.extend([f"## {BERICHT_ARTEFAKTE}", "- Laufbezogene Artefakte sind im Dokumentationsbericht referenziert.", ""])
-    return "\n".join(zeilen).strip() + "\n"
+    Der Bericht unterstützt zwei Modi:
+    - ``voll``: Vollbericht mit technischen Detailblöcken je Server.
+    - ``kurz``: Kurzbericht für Management/Loop ohne tiefe technische Einzelwerte.
+    """
+    return "".join(
+        iter_markdown_abschnitte(
+            ergebnisse,
+            kunde=kunde,
+            umgebung=umgebung,
+            template_version=template_version,
+            berichtsmodus=berichtsmodus,
+            quelle=quelle,
+        )
+    )
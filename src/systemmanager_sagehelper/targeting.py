@@ -8,15 +8,23 @@ Dieses Modul ist die einzige fachliche Quelle für:
 
 from __future__ import annotations
 
+import sys
+from functools import lru_cache
+
 from .models import ServerZiel
 
 
 STANDARD_ROLLE = "APP"
 
 
+@lru_cache(maxsize=4096)
 def normalisiere_servernamen(servername: str) -> str:
-    """Normalisiert einen Servernamen für konsistente Vergleiche (z. B. Duplikate)."""
-    return servername.strip().lower()
+    """Normalisiert einen Servernamen für konsistente Vergleiche (z. B. Duplikate).
+
+    Dieselben Namen werden in GUI und Analyse wiederholt verglichen; das Ergebnis wird daher zwischengespeichert
+    und interniert, sodass von jedem normalisierten Namen nur eine gemeinsame Kopie im Speicher liegt.
+    """
+    return sys.intern(servername.strip().lower())
 
 
 def parse_liste(wert: str, *, to_upper: bool = False) -> list[str]:
@@ -57,8 +65,9 @@ def baue_serverziele(servernamen: list[str], deklarationen: dict[str, list[str]]
     return ziele
 
 
-def rollen_aus_bool_flags(*, sql: bool, app: bool, ctx: bool, dc: bool = False) -> list[str]:
-    """Leitet Rollenliste aus booleschen GUI-Flags ab."""
+@lru_cache(maxsize=None)
+def _rollen_fuer_flags(sql: bool, app: bool, ctx: bool, dc: bool) -> tuple[str, ...]:
+    """Liefert die Rollen einer Flag-Kombination; es gibt nur 16 Kombinationen, daher ungebunden gecacht."""
     rollen: list[str] = []
     if sql:
         rollen.append("SQL")
@@ -68,4 +77,9 @@ def rollen_aus_bool_flags(*, sql: bool, app: bool, ctx: bool, dc: bool = False)
         rollen.append("CTX")
     if dc:
         rollen.append("DC")
-    return rollen
+    return tuple(rollen)
+
+
+def rollen_aus_bool_flags(*, sql: bool, app: bool, ctx: bool, dc: bool = False) -> list[str]:
+    """Leitet Rollenliste aus booleschen GUI-Flags ab (jeweils eine neue, frei änderbare Liste)."""
+    return list(_rollen_fuer_flags(bool(sql), bool(app), bool(ctx), bool(dc)))
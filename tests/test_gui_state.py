@@ -104,3 +104,15 @@ def test_onboarding_status_migration_markiert_abbruch_konsistent(tmp_path: Path)
 
     assert geladen["onboarding_abgeschlossen"] is False
     assert geladen["onboarding_status"] == "abgebrochen"
+
+
+def test_speichere_gesamtzustand_ersetzt_datei_ohne_temporaere_reste(tmp_path: Path) -> None:
+    """Das atomare Speichern soll die Datei ersetzen und keine Temporärdateien zurücklassen."""
+    dateipfad = tmp_path / "gui_state.json"
+    dateipfad.write_text("{}", encoding="utf-8")
+    store = GUIStateStore(dateipfad)
+
+    store.speichere_modulzustand("server_analysis", {"serverlisten": [{"servername": "srv-ä"}]})
+
+    assert store.lade_modulzustand("server_analysis")["serverlisten"] == [{"servername": "srv-ä"}]
+    assert [pfad.name for pfad in tmp_path.iterdir()] == ["gui_state.json"]
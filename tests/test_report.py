@@ -11,7 +11,7 @@ from systemmanager_sagehelper.models import (
     Netzwerkidentitaet,
     PortStatus,
 )
-from systemmanager_sagehelper.report import render_markdown
+from systemmanager_sagehelper.report import iter_markdown_abschnitte, render_markdown
 
 
 class TestReport(unittest.TestCase):
@@ -92,6 +92,22 @@ class TestReport(unittest.TestCase):
         positionen = [md.index(abschnitt) for abschnitt in abschnitte]
         self.assertEqual(positionen, sorted(positionen))
 
+    def test_abschnittsweise_ausgabe_entspricht_gesamtbericht(self) -> None:
+        """Die gestreamten Abschnitte sollen zusammengesetzt exakt den Gesamtbericht ergeben."""
+        ergebnisse = [
+            AnalyseErgebnis(server="srv-01", zeitpunkt=datetime(2026, 1, 2, 11, 0, 0), rollen=["APP"]),
+            AnalyseErgebnis(server="srv-02", zeitpunkt=datetime(2026, 1, 2, 11, 0, 0), hinweise=["Hinweis"]),
+        ]
+
+        for modus in ("voll", "kurz"):
+            abschnitte = list(iter_markdown_abschnitte(ergebnisse, berichtsmodus=modus))
+            gesamt = render_markdown(ergebnisse, berichtsmodus=modus)
+            # Das Erzeugungsdatum kann zwischen beiden Aufrufen wechseln und wird daher ausgeblendet.
+            ohne_datum = lambda text: "\n".join(z for z in text.splitlines() if not z.startswith("- Datum:"))
+            self.assertEqual(ohne_datum("".join(abschnitte)), ohne_datum(gesamt))
+            self.assertTrue(all(abschnitt.endswith("\n") for abschnitt in abschnitte))
+        self.assertEqual(len(list(iter_markdown_abschnitte(ergebnisse, berichtsmodus="voll"))), 2 + len(ergebnisse))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import tkinter
 from datetime import datetime
+from itertools import count
 
 from server_analysis_gui import (
     DiscoveryTabellenTreffer,
@@ -18,6 +20,112 @@ from server_analysis_gui import (
 from systemmanager_sagehelper.models import AnalyseErgebnis, PortStatus
 
 
+class _SynchronerMaster:
+    """Fake-Master ohne `after`: Hintergrundläufe laufen synchron, Leerlauf-Callbacks sofort."""
+
+    def after_idle(self, callback) -> None:
+        callback()
+
+
+class _FakeVar:
+    """Ersatz für Tk-Variablen mit `get`/`set`."""
+
+    def __init__(self, value: object = "") -> None:
+        self.value = value
+
+    def get(self) -> object:
+        return self.value
+
+    def set(self, value: object) -> None:
+        self.value = value
+
+
+class _FakeShell:
+    """Shell-Ersatz: bestätigt Aktionen, zeichnet Status und Meldungen auf und ignoriert übrige Aufrufe."""
+
+    def __init__(self) -> None:
+        self.status: list[str] = []
+        self.logs: list[str] = []
+
+    def bestaetige_aktion(self, *_args) -> bool:
+        return True
+
+    def setze_status(self, text: str) -> None:
+        self.status.append(text)
+
+    def logge_meldung(self, text: str, **_kwargs) -> None:
+        self.logs.append(text)
+
+    def __getattr__(self, _name: str):
+        return lambda *_args, **_kwargs: None
+
+
+# Ein gemeinsamer Interpreter für alle Tests: Tcl bricht ab, wenn ein Interpreter in einem Worker-Thread eingesammelt wird.
+_TCL = tkinter.Tcl()
+_TCL_BEFEHLSNUMMERN = count(1)
+
+
+class _FakeTcl:
+    """Reicht Aufrufe an den gemeinsamen Tcl-Interpreter weiter und zeichnet sie auf."""
+
+    def __init__(self) -> None:
+        self.aufrufe: list[tuple[object, ...]] = []
+
+    def call(self, *args: object) -> object:
+        self.aufrufe.append(args)
+        return _TCL.call(*args)
+
+
+class _FakeTree:
+    """Treeview-Ersatz mit Tcl-Befehl, der eingefügte Zeilen, gesetzte Zellen und Filteraufrufe aufzeichnet."""
+
+    def __init__(self) -> None:
+        self.zeilen: dict[str, tuple] = {}
+        self.gesetzt: list[tuple[str, str, str]] = []
+        self.gefiltert: list[tuple[str, ...]] = []
+        self.auswahl: tuple[str, ...] = ()
+        # Spalten- und Zeilen-ID unter dem Mauszeiger für `identify`-Abfragen; leere Zeile = kein Zellklick.
+        self.klick_spalte = ""
+        self.klick_zeile = ""
+        self.tk = _FakeTcl()
+        # Tcl-Skripte wie `$tree set ...` landen über diesen Befehl wieder bei den Python-Methoden.
+        self._tcl_name = f"fake_tree_{next(_TCL_BEFEHLSNUMMERN)}"
+        _TCL.createcommand(self._tcl_name, lambda befehl, *args: getattr(self, befehl)(*args) or "")
+
+    def __str__(self) -> str:
+        return self._tcl_name
+
+    @property
+    def werte(self) -> dict[tuple[str, str], str]:
+        return {(item_id, column): value for item_id, column, value in self.gesetzt}
+
+    def insert(self, _parent: str, _index: str, values: tuple) -> str:
+        item_id = f"row-{len(self.zeilen) + 1}"
+        self.zeilen[item_id] = values
+        return item_id
+
+    def selection(self) -> tuple[str, ...]:
+        return self.auswahl
+
+    def delete(self, *item_ids: str) -> None:
+        for item_id in item_ids:
+            self.zeilen.pop(item_id, None)
+
+    def set(self, item_id: str, column: str, value: str) -> None:
+        self.gesetzt.append((item_id, column, value))
+
+    def set_children(self, item: str, *kinder: str) -> None:
+        self.gefiltert.append((item, *kinder))
+
+    def identify_column(self, _x: int) -> str:
+        return self.klick_spalte
+
+    def identify(self, component: str, _x: object, _y: object) -> str:
+        if component == "region":
+            return "cell" if self.klick_zeile else "nothing"
+        return self.klick_zeile
+
+
 def test_baue_serverziele_mit_rollenabbildung() -> None:
     """Die Rollen sollen direkt aus dem Zeilenmodell übernommen werden."""
     zeilen = [
@@ -46,6 +154,9 @@ def test_deklarationszusammenfassung_enthaelt_quelle_und_rollen() -> None:
     assert "So wurden die Server deklariert:" in zusammenfassung
     assert "srv-app-01 | Rollen: APP | Quelle: manuell | Rollenquelle: manuell gesetzt" in zusammenfassung
     assert "srv-sql-01 | Rollen: SQL | Quelle: Netzwerkerkennung | Rollenquelle: automatisch erkannt" in zusammenfassung
+    assert _deklarationszusammenfassung(
+        ziele, zeilen, quelle_pro_server={"srv-app-01": "manuell", "srv-sql-01": "Discovery"}
+    ) == zusammenfassung
 
 
 def test_kurzstatus_und_detailzeilen_rendert_serverbloecke() -> None:
@@ -175,30 +286,6 @@ def test_analyse_starten_erzeugt_bericht_und_zeigt_verweis(monkeypatch) -> None:
     """Nach erfolgreicher Analyse soll ein Bericht erzeugt und als Verweis sichtbar werden."""
     from server_analysis_gui import MehrserverAnalyseGUI
 
-    class _FakeVar:
-        def __init__(self, value: str = "") -> None:
-            self.value = value
-
-        def get(self) -> str:
-            return self.value
-
-        def set(self, value: str) -> None:
-            self.value = value
-
-    class _FakeTree:
-        def __init__(self) -> None:
-            self.children: list[str] = []
-            self.status_updates: dict[tuple[str, str], str] = {}
-
-        def get_children(self, _root: str = "") -> list[str]:
-            return list(self.children)
-
-        def delete(self, _item_id: str) -> None:
-            return
-
-        def set(self, item_id: str, column: str, value: str) -> None:
-            self.status_updates[(item_id, column)] = value
-
     class _FakeSummaryLabel:
         def __init__(self) -> None:
             self.text = ""
@@ -238,6 +325,7 @@ def test_analyse_starten_erzeugt_bericht_und_zeigt_verweis(monkeypatch) -> None:
     gui._zeilen_nach_id = {
         "row-1": ServerTabellenZeile(servername="srv-01", app=True, sql=False, ctx=False, status="bereit")
     }
+    gui._id_nach_norm_name = {"srv-01": "row-1"}
     gui.tree = _FakeTree()
     gui.tree_ergebnisse = _FakeTree()
     gui.lbl_executive_summary = _FakeSummaryLabel()
@@ -248,8 +336,10 @@ def test_analyse_starten_erzeugt_bericht_und_zeigt_verweis(monkeypatch) -> None:
     gui._letzte_export_lauf_id = ""
     gui._letzte_ergebnisse = []
     gui.shell = _FakeShell()
-    gui.master = type("Master", (), {"update_idletasks": staticmethod(lambda: None)})()
-    gui.speichern = lambda: None
+    gui.master = _SynchronerMaster()
+    gui._analyse_memo = {}
+    gui.modulzustand = {}
+    gui.speichern = lambda **_kwargs: None
     gui._zeige_ergebnisse_aufklappbar = lambda _ergebnisse: None
 
     ergebnis = AnalyseErgebnis(
@@ -264,7 +354,7 @@ def test_analyse_starten_erzeugt_bericht_und_zeigt_verweis(monkeypatch) -> None:
     monkeypatch.setattr("server_analysis_gui.analysiere_mehrere_server", lambda _ziele, lauf_id=None: [ergebnis])
     monkeypatch.setattr(
         "server_analysis_gui._schreibe_analyse_report",
-        lambda _ergebnisse, _pfad: ("docs/test_report.md", "2026-01-02T03:04:05"),
+        lambda _ergebnisse, _pfad, **_kwargs: ("docs/test_report.md", "2026-01-02T03:04:05"),
     )
 
     gui.analyse_starten()
@@ -273,6 +363,7 @@ def test_analyse_starten_erzeugt_bericht_und_zeigt_verweis(monkeypatch) -> None:
     assert "Lauf-ID: lauf-001" in gui._report_verweis_var.get()
     assert gui.shell.erfolg_anzeigen is True
     assert any("Analysebericht erstellt: docs/test_report.md" in eintrag for eintrag in gui.shell.logs)
+    assert gui.tree.werte[("row-1", "status")] == "analysiert"
 
 
 def test_filter_discovery_treffer_mit_standardfilter_auf_erreichbarkeit() -> None:
@@ -306,3 +397,757 @@ def test_filter_discovery_treffer_mit_standardfilter_auf_erreichbarkeit() -> Non
 
     assert [item.hostname for item in nur_erreichbare] == ["srv-app-01"]
     assert [item.hostname for item in alle] == ["srv-app-01", "srv-rdns-only", "srv-offline"]
+
+
+def test_filter_discovery_treffer_nutzt_gecachte_suchschluessel() -> None:
+    """Der Suchfilter soll Groß-/Kleinschreibung ignorieren und Hostnamen-Änderungen berücksichtigen."""
+    treffer = DiscoveryTabellenTreffer(
+        hostname="SRV-App-01",
+        ip_adresse="10.0.0.21",
+        erreichbar=True,
+        dienste="1433",
+        vertrauensgrad=0.9,
+    )
+
+    assert _filter_discovery_treffer([treffer], filtertext="srv-app", nur_erreichbare=True) == [treffer]
+
+    treffer.setze_hostname("SRV-SQL-01")
+
+    assert _filter_discovery_treffer([treffer], filtertext="srv-app", nur_erreichbare=True) == []
+    assert _filter_discovery_treffer([treffer], filtertext="Sql", nur_erreichbare=True) == [treffer]
+
+
+def test_parse_discovery_range_zeile_validiert_format_ohne_folgefehler() -> None:
+    """Fehleingaben sollen als verständlicher Formatfehler statt als Folgefehler gemeldet werden."""
+    import pytest
+
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+
+    segment = gui._parse_discovery_range_zeile(" 10.0.5.40-80 ")
+    assert (segment.basis, segment.start, segment.ende) == ("10.0.5", 40, 80)
+
+    for eingabe in ("10.0.5.40", "10.0.5.40-abc", "10.0.x.40-50"):
+        with pytest.raises(ValueError, match="Ungültiges Range-Format"):
+            gui._parse_discovery_range_zeile(eingabe)
+    with pytest.raises(ValueError, match="Ungültige IPv4-Basis"):
+        gui._parse_discovery_range_zeile("10.0.300.1-5")
+
+
+def test_duplikatpruefung_nutzt_normalisierten_namensindex() -> None:
+    """Einfügen und Löschen sollen den Index normalisierter Servernamen konsistent halten."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {}
+    gui._id_nach_norm_name = {}
+    gui.tree = _FakeTree()
+    gui.shell = _FakeShell()
+    gui._aktualisiere_button_zustaende = lambda: None
+
+    gui._fuege_zeile_ein(ServerTabellenZeile(servername="SRV-01"))
+    gui._fuege_zeile_ein(ServerTabellenZeile(servername=" srv-01 "))
+    assert len(gui._zeilen_nach_id) == 1
+    assert "srv-01" in gui._id_nach_norm_name
+    assert gui._zeile_fuer_server("SRV-01 ").servername == "SRV-01"
+
+    gui.tree.auswahl = tuple(gui._zeilen_nach_id)
+    gui.eintrag_loeschen()
+    assert "srv-01" not in gui._id_nach_norm_name
+    assert gui._id_nach_norm_name == {}
+
+
+def test_fuege_zeilen_ein_uebernimmt_stapel_ohne_duplikate() -> None:
+    """Der Stapel-Import soll Duplikate überspringen und Buttons nur einmal aktualisieren."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    aktualisierungen: list[bool] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {}
+    gui._id_nach_norm_name = {"srv-alt": "row-alt"}
+    gui.tree = _FakeTree()
+    gui._aktualisiere_button_zustaende = lambda: aktualisierungen.append(True)
+
+    anzahl = gui._fuege_zeilen_ein(
+        [
+            ServerTabellenZeile(servername="SRV-01", sql=True),
+            ServerTabellenZeile(servername="srv-01"),
+            ServerTabellenZeile(servername="srv-alt"),
+            ServerTabellenZeile(servername="srv-02"),
+        ]
+    )
+
+    assert anzahl == 2
+    assert [werte[0] for werte in gui.tree.zeilen.values()] == ["SRV-01", "srv-02"]
+    assert gui._id_nach_norm_name == {"srv-alt": "row-alt", "srv-01": "row-1", "srv-02": "row-2"}
+    assert len(aktualisierungen) == 1
+
+
+def test_bulk_unterdrueckt_button_aktualisierung_auch_verschachtelt() -> None:
+    """Verschachtelte Massenänderungen sollen Buttons erst nach dem äußersten Block aktualisieren."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._lauf_aktiv = True
+    aufrufe: list[str] = []
+
+    class _FakeWidget:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def get(self) -> str:
+            return ""
+
+        def configure(self, **_kwargs) -> None:
+            aufrufe.append(self.name)
+
+    gui.entry_servername = _FakeWidget("entry")
+    gui.btn_hinzufuegen = _FakeWidget("hinzufuegen")
+    gui.btn_analyse = _FakeWidget("analyse")
+    gui.btn_loeschen = _FakeWidget("loeschen")
+    gui.btn_discovery = _FakeWidget("discovery")
+    gui.btn_discovery_namen = _FakeWidget("discovery_namen")
+
+    with gui._bulk():
+        with gui._bulk():
+            gui._aktualisiere_button_zustaende()
+        assert aufrufe == []
+    assert aufrufe
+    assert gui._button_update_suspendiert == 0
+
+
+def test_rollenableitung_nutzt_erkannte_dienste_ohne_erneutes_zerlegen() -> None:
+    """Liegt die Rohliste der Dienste vor, soll sie statt des Anzeige-Strings verwendet werden."""
+    treffer = DiscoveryTabellenTreffer(
+        hostname="srv-sql-02",
+        ip_adresse="10.0.0.14",
+        erreichbar=True,
+        dienste="Anzeige ohne Portliste",
+        vertrauensgrad=0.8,
+        erkannte_dienste=("1433",),
+    )
+    assert _rollen_aus_discovery_treffer(treffer) == ["SQL"]
+
+
+def test_filter_discovery_treffer_ip_suchbegriff_findet_adresse_und_hostname() -> None:
+    """Ziffern-/Punkt-Suchbegriffe sollen Adressen und weiterhin auch Hostnamen mit Ziffern treffen."""
+    treffer = [
+        DiscoveryTabellenTreffer(hostname="srv-app", ip_adresse="10.0.0.21", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+        DiscoveryTabellenTreffer(hostname="SRV-21", ip_adresse="10.0.0.30", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+        DiscoveryTabellenTreffer(hostname="srv-db", ip_adresse="10.0.0.40", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+    ]
+
+    assert [t.hostname for t in _filter_discovery_treffer(treffer, filtertext=" 21 ", nur_erreichbare=False)] == ["srv-app", "SRV-21"]
+    assert [t.hostname for t in _filter_discovery_treffer(treffer, filtertext="0.0.4", nur_erreichbare=False)] == ["srv-db"]
+
+
+def test_discovery_starten_prueft_hosts_parallel_in_range_reihenfolge(monkeypatch) -> None:
+    """Parallel geprüfte Hosts sollen unabhängig von der Abschlussreihenfolge in Range-Reihenfolge übernommen werden."""
+    import threading
+    import time
+
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI
+    from systemmanager_sagehelper.analyzer import DiscoveryRangeSegment
+    from systemmanager_sagehelper.models import DiscoveryErgebnis
+
+    aktive = 0
+    max_parallel = 0
+    sperre = threading.Lock()
+
+    def _fake_discovery(*, basis: str, start: int, ende: int, konfiguration) -> list[DiscoveryErgebnis]:
+        nonlocal aktive, max_parallel
+        with sperre:
+            aktive += 1
+            max_parallel = max(max_parallel, aktive)
+        # Spätere Hosts werden früher fertig, damit die Abschlussreihenfolge von der Range-Reihenfolge abweicht.
+        time.sleep(0.01 * (6 - start))
+        with sperre:
+            aktive -= 1
+        if start == 3:
+            raise OSError("Host nicht erreichbar")
+        return [DiscoveryErgebnis(hostname=f"srv-{start}", ip_adresse=f"{basis}.{start}", erreichbar=True)]
+
+    monkeypatch.setattr(server_analysis_gui, "entdecke_server_ergebnisse", _fake_discovery)
+    server_analysis_gui._DISCOVERY_CACHE.leere()
+
+    uebernommen: list[str] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.shell = _FakeShell()
+    gui.master = object()
+    gui._letzter_discovery_modus = _FakeVar()
+    gui._letzte_discovery_range = _FakeVar()
+    gui._validiere_discovery_eingaben = lambda: ([DiscoveryRangeSegment(basis="10.0.0", start=1, ende=5)], [], False)
+    gui._setze_laufstatus = lambda *_args, **_kwargs: None
+    gui._aktualisiere_button_zustaende = lambda: None
+    gui._uebernehme_discovery_treffer = lambda treffer, erfolgstitel: uebernommen.extend(item.hostname for item in treffer)
+
+    gui.discovery_starten()
+
+    assert uebernommen == ["srv-1", "srv-2", "srv-4", "srv-5"]
+    assert max_parallel > 1
+    assert any("Verarbeitet 5/5 | Fehlerläufe: 1" in zeile for zeile in gui.shell.logs)
+    # Die laufende Trefferzahl erscheint bereits während des Laufs in der Statuszeile.
+    assert "Netzwerkerkennung läuft: 4 Treffer bisher" in gui.shell.status
+
+
+def test_discovery_cache_liefert_treffer_bis_zum_ablauf(monkeypatch) -> None:
+    """Zwischengespeicherte Treffer (auch leere) sollen bis zum Ablauf der TTL wiederverwendet werden."""
+    import server_analysis_gui
+    from systemmanager_sagehelper.models import DiscoveryErgebnis
+
+    jetzt = [1000.0]
+    monkeypatch.setattr(server_analysis_gui.time, "monotonic", lambda: jetzt[0])
+    cache = server_analysis_gui._DiscoveryTrefferCache()
+    aufrufe: list[int] = []
+
+    def _ermittler(host: int, treffer: list[DiscoveryErgebnis]):
+        def _ermittle() -> list[DiscoveryErgebnis]:
+            aufrufe.append(host)
+            return treffer
+
+        return _ermittle
+
+    srv_1 = [DiscoveryErgebnis(hostname="srv-1", ip_adresse="10.0.0.1", erreichbar=True)]
+    assert [t.hostname for t in cache.hole_oder_ermittle(("10.0.0", 1), 300.0, _ermittler(1, srv_1))] == ["srv-1"]
+    assert cache.hole_oder_ermittle(("10.0.0", 2), 300.0, _ermittler(2, [])) == []
+
+    # Innerhalb der TTL kommen Treffer und leere Ergebnisse aus dem Cache.
+    assert [t.hostname for t in cache.hole_oder_ermittle(("10.0.0", 1), 300.0, _ermittler(1, []))] == ["srv-1"]
+    assert cache.hole_oder_ermittle(("10.0.0", 2), 300.0, _ermittler(2, srv_1)) == []
+    assert aufrufe == [1, 2]
+
+    jetzt[0] += 300.0
+    assert cache.hole_oder_ermittle(("10.0.0", 1), 300.0, _ermittler(1, [])) == []
+    assert aufrufe == [1, 2, 1]
+
+
+def test_discovery_cache_verdraengt_alte_und_raeumt_abgelaufene_eintraege(monkeypatch) -> None:
+    """Der Cache soll auf die Obergrenze begrenzt bleiben und abgelaufene Hosts beim nächsten Zugriff entfernen."""
+    import server_analysis_gui
+
+    jetzt = [1000.0]
+    monkeypatch.setattr(server_analysis_gui.time, "monotonic", lambda: jetzt[0])
+    cache = server_analysis_gui._DiscoveryTrefferCache(max_eintraege=2)
+
+    for host in (1, 2, 3):
+        cache.hole_oder_ermittle(("10.0.0", host), 300.0, list)
+    assert list(cache._eintraege) == [("10.0.0", 2), ("10.0.0", 3)]
+
+    jetzt[0] += 300.0
+    cache.hole_oder_ermittle(("10.0.0", 9), 300.0, list)
+    assert list(cache._eintraege) == [("10.0.0", 9)]
+
+
+def test_discovery_cache_buendelt_gleichzeitige_abfragen() -> None:
+    """Gleichzeitige Abfragen desselben Hosts sollen nur eine Ermittlung auslösen."""
+    import threading
+
+    import server_analysis_gui
+    from systemmanager_sagehelper.models import DiscoveryErgebnis
+
+    cache = server_analysis_gui._DiscoveryTrefferCache()
+    gestartet = threading.Event()
+    freigabe = threading.Event()
+    aufrufe: list[int] = []
+
+    def _ermittle() -> list[DiscoveryErgebnis]:
+        aufrufe.append(1)
+        gestartet.set()
+        freigabe.wait(timeout=2)
+        return [DiscoveryErgebnis(hostname="srv-1", ip_adresse="10.0.0.1", erreichbar=True)]
+
+    ergebnisse: list[list[str]] = []
+    threads = [
+        threading.Thread(target=lambda: ergebnisse.append([t.hostname for t in cache.hole_oder_ermittle(("10.0.0", 1), 300.0, _ermittle)]))
+        for _ in range(3)
+    ]
+    threads[0].start()
+    assert gestartet.wait(timeout=2)
+    for thread in threads[1:]:
+        thread.start()
+    freigabe.set()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert aufrufe == [1]
+    assert ergebnisse == [["srv-1"]] * 3
+
+
+def test_setze_server_status_setzt_alle_zeilen_mit_einem_tcl_aufruf() -> None:
+    """Der Status soll für alle Zeilen in einem Interpreter-Aufruf gesetzt werden, auch mit Sonderzeichen."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.tree = _FakeTree()
+    gui._zeilen_nach_id = {
+        "I001": ServerTabellenZeile(servername="srv-01"),
+        "I002": ServerTabellenZeile(servername="srv-02"),
+    }
+
+    gui._setze_server_status("läuft {1/2} $x")
+
+    assert len(gui.tree.tk.aufrufe) == 1
+    assert gui.tree.gesetzt == [
+        ("I001", "status", "läuft {1/2} $x"),
+        ("I002", "status", "läuft {1/2} $x"),
+    ]
+    assert {zeile.status for zeile in gui._zeilen_nach_id.values()} == {"läuft {1/2} $x"}
+
+    # Unveränderte Zeilen lösen keinen weiteren Tabellenaufruf aus.
+    gui._zeilen_nach_id["I003"] = ServerTabellenZeile(servername="srv-03")
+    gui._setze_server_status("läuft {1/2} $x")
+    assert len(gui.tree.tk.aufrufe) == 2
+    assert [item_id for item_id, _spalte, _wert in gui.tree.gesetzt] == ["I001", "I002", "I003"]
+
+
+def test_serialisiere_zeile_entspricht_asdict_und_ist_ladbar() -> None:
+    """Die flache Serialisierung soll dasselbe Format wie `asdict` liefern und wieder ladbar sein."""
+    from dataclasses import asdict
+
+    from server_analysis_gui import _serialisiere_zeile
+
+    zeile = ServerTabellenZeile(servername="srv-01", sql=True, rollenhinweise=("sql_instanz:sage",), vertrauensgrad=0.7)
+
+    daten = _serialisiere_zeile(zeile)
+
+    # Der abgeleitete Normalname wird nicht persistiert, sondern beim Laden neu berechnet.
+    erwartet = asdict(zeile)
+    assert erwartet.pop("name_norm") == "srv-01"
+    assert daten == erwartet
+    assert ServerTabellenZeile(**daten) == zeile
+
+
+def test_speichern_ueberspringt_unveraenderten_automatikstand(monkeypatch) -> None:
+    """Automatische Speicherungen sollen unveränderte Stände nicht erneut schreiben."""
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI, ServerAnalysePersistenzDaten
+
+    schreibvorgaenge: list[dict[str, object]] = []
+
+    def _fake_persistiere(*, state_store, modulzustand, daten, shell):
+        schreibvorgaenge.append(dict(daten.rollen))
+        return modulzustand
+
+    monkeypatch.setattr(server_analysis_gui, "persistiere_serveranalyse_zustand", _fake_persistiere)
+
+    def _daten(rollen: dict[str, list[str]]) -> ServerAnalysePersistenzDaten:
+        return ServerAnalysePersistenzDaten(
+            serverlisten=[],
+            rollen=rollen,
+            letzte_discovery_range="",
+            letzter_discovery_modus="range",
+            letzte_discovery_namen="",
+            letzte_discovery_eingabe={},
+            ausgabepfade={},
+            server_summary=[],
+            letzte_kerninfos=[],
+            bericht_verweise=[],
+            letzter_exportpfad="",
+            letzter_exportzeitpunkt="",
+            letzte_export_lauf_id="",
+        )
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.state_store = None
+    gui.modulzustand = {}
+    gui.shell = None
+
+    gui.speichern(_daten({"srv-01": ["APP"]}), nur_bei_aenderung=True)
+    gui.speichern(_daten({"srv-01": ["APP"]}), nur_bei_aenderung=True)
+    gui.speichern(_daten({"srv-01": ["APP", "SQL"]}), nur_bei_aenderung=True)
+
+    # Explizites Speichern schreibt immer, ohne den Gesamtstand für einen Fingerabdruck zu serialisieren.
+    fingerabdruecke: list[object] = []
+    original_dumps = server_analysis_gui.json.dumps
+    monkeypatch.setattr(server_analysis_gui.json, "dumps", lambda *args, **kwargs: fingerabdruecke.append(1) or original_dumps(*args, **kwargs))
+    gui.speichern(_daten({"srv-01": ["APP", "SQL"]}))
+    assert fingerabdruecke == []
+
+    # Danach schreibt die nächste bedingte Speicherung wieder, da der Fingerabdruck verworfen wurde.
+    gui.speichern(_daten({"srv-01": ["APP", "SQL"]}), nur_bei_aenderung=True)
+
+    assert len(schreibvorgaenge) == 4
+
+
+def test_discovery_servernamen_starten_laeuft_ueber_hintergrundlauf(monkeypatch) -> None:
+    """Die Servernamenprüfung soll über den Hintergrundlauf ausgeführt und danach übernommen werden."""
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI
+    from systemmanager_sagehelper.models import DiscoveryErgebnis
+
+    monkeypatch.setattr(
+        server_analysis_gui,
+        "entdecke_server_namen",
+        lambda *, hosts, konfiguration: [DiscoveryErgebnis(hostname=host, ip_adresse="", erreichbar=True) for host in hosts],
+    )
+
+    laufstatus: list[bool] = []
+    uebernommen: list[str] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.shell = _FakeShell()
+    gui.master = object()
+    gui._letzter_discovery_modus = _FakeVar("range")
+    gui._discovery_ad_seeds_var = _FakeVar(False)
+    gui._lese_discovery_namen_aus_textfeld = lambda: ["srv-01", "srv-02"]
+    gui._setze_laufstatus = lambda aktiv, **_kwargs: laufstatus.append(aktiv)
+    gui._aktualisiere_button_zustaende = lambda: None
+    gui._uebernehme_discovery_treffer = lambda treffer, erfolgstitel: uebernommen.extend(item.hostname for item in treffer)
+
+    gui.discovery_servernamen_starten()
+
+    assert uebernommen == ["srv-01", "srv-02"]
+    assert laufstatus == [True, False]
+    assert gui.shell.status[-1] == "Servernamenprüfung abgeschlossen"
+
+
+def test_worker_pool_wird_wiederverwendet_und_beim_schliessen_freigegeben() -> None:
+    """Der Worker-Pool soll über Läufe hinweg geteilt und erst beim Schließen freigegeben werden."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+
+    executor = gui._hole_executor()
+
+    assert gui._hole_executor() is executor
+    assert executor.submit(lambda: 42).result() == 42
+
+    gui._beende_executor()
+
+    assert gui._executor is None
+    assert gui._hole_executor() is not executor
+    gui._beende_executor()
+
+
+def test_zurueck_behaelt_worker_pool_waehrend_eines_laufs() -> None:
+    """Zurück soll wie Schließen einen aktiven Lauf nur abbrechen, statt den geteilten Pool abzuschalten."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    hinweise: list[str] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._lauf_aktiv = True
+    gui._abbruch_anfordern = lambda: hinweise.append("abbruch")
+    gui.shell = type("Shell", (), {"zeige_info": staticmethod(lambda titel, *_args: hinweise.append(titel))})()
+    gui.master = type("Master", (), {"destroy": staticmethod(lambda: hinweise.append("destroy"))})()
+    executor = gui._hole_executor()
+
+    gui._zurueck()
+
+    assert hinweise == ["abbruch", "Lauf aktiv"]
+    assert gui._executor is executor
+    assert executor.submit(lambda: 42).result() == 42
+    gui._beende_executor()
+
+
+def test_analyse_starten_analysiert_server_parallel_in_tabellenreihenfolge(monkeypatch) -> None:
+    """Server laufen parallel; Ergebnisse bleiben in Tabellenreihenfolge und Status wird je Abschluss gesetzt."""
+    import threading
+    import time
+
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    aktive = 0
+    max_parallel = 0
+    sperre = threading.Lock()
+
+    def _fake_analyse(ziele, lauf_id=None) -> list[AnalyseErgebnis]:
+        nonlocal aktive, max_parallel
+        with sperre:
+            aktive += 1
+            max_parallel = max(max_parallel, aktive)
+        nummer = int(ziele[0].name[-1])
+        time.sleep(0.01 * (4 - nummer))
+        with sperre:
+            aktive -= 1
+        if nummer == 2:
+            raise OSError("WinRM nicht erreichbar")
+        return [AnalyseErgebnis(server=ziele[0].name, zeitpunkt=datetime.now(), lauf_id=lauf_id)]
+
+    status_verlauf: list[tuple[str, str]] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {f"row-{nummer}": ServerTabellenZeile(servername=f"srv-0{nummer}", app=True) for nummer in (1, 2, 3)}
+    gui._id_nach_norm_name = {f"srv-0{nummer}": f"row-{nummer}" for nummer in (1, 2, 3)}
+    gui.tree = _FakeTree()
+    gui._ausgabe_pfad = _FakeVar("docs/test_report.md")
+    gui._report_verweis_var = _FakeVar()
+    gui.shell = _FakeShell()
+    gui.master = _SynchronerMaster()
+    gui._analyse_memo = {}
+    gui.modulzustand = {}
+    gui.speichern = lambda **_kwargs: None
+    gui._setze_laufstatus = lambda *_args, **_kwargs: None
+    gui._zeige_ergebnisse_aufklappbar = lambda _ergebnisse: None
+    original = gui._setze_status_fuer_server
+    gui._setze_status_fuer_server = lambda server, status: (status_verlauf.append((server, status)), original(server, status))
+
+    monkeypatch.setattr("server_analysis_gui.erstelle_lauf_id", lambda: "lauf-par")
+    monkeypatch.setattr("server_analysis_gui.setze_lauf_id", lambda _lauf_id: None)
+    monkeypatch.setattr("server_analysis_gui.analysiere_mehrere_server", _fake_analyse)
+    monkeypatch.setattr("server_analysis_gui._schreibe_analyse_report", lambda _ergebnisse, _pfad, **_kwargs: ("docs/test_report.md", "2026-01-02T03:04:05"))
+
+    gui.analyse_starten()
+
+    assert max_parallel > 1
+    assert [ergebnis.server for ergebnis in gui._letzte_ergebnisse] == ["srv-01", "srv-03"]
+    assert sorted(status_verlauf) == [("srv-01", "analysiert"), ("srv-03", "analysiert")]
+    assert gui._zeilen_nach_id["row-2"].status == "nicht analysiert"
+    assert gui.tree.werte[("row-1", "status")] == "analysiert"
+
+
+def test_analyse_starten_uebernimmt_anmerkungen_aus_dem_startzeitpunkt(monkeypatch) -> None:
+    """Während des Laufs geänderte Anmerkungen dürfen nicht in die Ergebnisse dieses Laufs einfließen."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    zeile = ServerTabellenZeile(servername="srv-01", manuelle_anmerkung="vor dem Lauf")
+
+    def _fake_analyse(ziele, lauf_id=None) -> list[AnalyseErgebnis]:
+        # Simuliert eine Bearbeitung im Tk-Thread, während der Worker noch analysiert.
+        zeile.manuelle_anmerkung = "während des Laufs"
+        return [AnalyseErgebnis(server=ziele[0].name, zeitpunkt=datetime.now(), lauf_id=lauf_id)]
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {"row-1": zeile}
+    gui._id_nach_norm_name = {"srv-01": "row-1"}
+    gui.tree = _FakeTree()
+    gui._ausgabe_pfad = _FakeVar("docs/test_report.md")
+    gui._report_verweis_var = _FakeVar()
+    gui.shell = _FakeShell()
+    gui.master = _SynchronerMaster()
+    gui._analyse_memo = {}
+    gui.modulzustand = {}
+    gui.speichern = lambda **_kwargs: None
+    gui._setze_laufstatus = lambda *_args, **_kwargs: None
+    gui._zeige_ergebnisse_aufklappbar = lambda _ergebnisse: None
+
+    monkeypatch.setattr("server_analysis_gui.erstelle_lauf_id", lambda: "lauf-anm")
+    monkeypatch.setattr("server_analysis_gui.setze_lauf_id", lambda _lauf_id: None)
+    monkeypatch.setattr("server_analysis_gui.analysiere_mehrere_server", _fake_analyse)
+    monkeypatch.setattr("server_analysis_gui._schreibe_analyse_report", lambda _ergebnisse, _pfad, **_kwargs: ("docs/test_report.md", "2026-01-02T03:04:05"))
+
+    gui.analyse_starten()
+
+    assert [ergebnis.manuelle_anmerkung for ergebnis in gui._letzte_ergebnisse] == ["vor dem Lauf"]
+
+
+def test_zeilenrollen_folgen_flags_und_liefern_unabhaengige_listen() -> None:
+    """Zeilenrollen sollen den Flags folgen und je Aufruf eine eigenständig änderbare Liste liefern."""
+    zeile = ServerTabellenZeile(servername="srv-01", sql=True, app=True)
+
+    erste = zeile.rollen()
+    erste.append("EXTRA")
+    zeile.ctx = True
+
+    assert zeile.rollen() == ["SQL", "APP", "CTX"]
+    assert ServerTabellenZeile(servername="srv-02", sql=True, app=True).rollen() == ["SQL", "APP"]
+
+
+def test_discovery_dialog_setzt_gefilterte_zeilen_mit_einem_aufruf() -> None:
+    """Der Dialog soll gefilterte Treffer mit einem `set_children`-Aufruf anzeigen und gleiche Filter überspringen."""
+    from server_analysis_gui import DiscoveryTrefferDialog
+
+    treffer = [
+        DiscoveryTabellenTreffer(hostname="srv-app-01", ip_adresse="10.0.0.1", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+        DiscoveryTabellenTreffer(hostname="srv-sql-01", ip_adresse="10.0.0.2", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+        DiscoveryTabellenTreffer(hostname="srv-app-02", ip_adresse="10.0.0.3", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+    ]
+    dialog = DiscoveryTrefferDialog.__new__(DiscoveryTrefferDialog)
+    dialog._treffer = treffer
+    dialog._id_zu_treffer = {f"I{index}": item for index, item in enumerate(treffer)}
+    dialog._letzter_filter = None
+    dialog.filter_var = _FakeVar("app")
+    dialog.nur_erreichbare_var = _FakeVar(True)
+    dialog.tree = _FakeTree()
+
+    dialog._render_treffer()
+    dialog._render_treffer()
+
+    assert dialog.tree.gefiltert == [("", "I0", "I2")]
+    assert dialog._sichtbare_ids == {"I0", "I2"}
+
+
+def test_persistenzdaten_serialisieren_nur_geaenderte_zeilen(monkeypatch) -> None:
+    """Beim Speichern sollen nur seit dem letzten Stand geänderte Zeilen neu serialisiert werden."""
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI, _serialisiere_zeile
+
+    serialisiert: list[str] = []
+
+    def _zaehlende_serialisierung(zeile: ServerTabellenZeile) -> dict[str, object]:
+        serialisiert.append(zeile.servername)
+        return _serialisiere_zeile(zeile)
+
+    monkeypatch.setattr(server_analysis_gui, "_serialisiere_zeile", _zaehlende_serialisierung)
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {"row-1": ServerTabellenZeile(servername="srv-01"), "row-2": ServerTabellenZeile(servername="srv-02", sql=True)}
+    gui._id_nach_norm_name = {"srv-01": "row-1", "srv-02": "row-2"}
+    gui._serialisiert_nach_id = {}
+    for name in (
+        "_letzte_discovery_namen",
+        "_letzte_discovery_range",
+        "_letzter_discovery_modus",
+        "_discovery_range_text_var",
+        "_discovery_seed_text_var",
+        "_discovery_ad_seeds_var",
+        "_ausgabe_pfad",
+    ):
+        setattr(gui, name, _FakeVar())
+    gui._server_summary = []
+    gui._baue_kerninfos = lambda: []
+    gui._letzter_export_pfad = gui._letzter_exportzeitpunkt = gui._letzte_export_lauf_id = ""
+    gui.tree = _FakeTree()
+
+    gui._baue_persistenzdaten()
+    gui._baue_persistenzdaten()
+    gui._setze_status_fuer_server("srv-02", "analysiert")
+    daten = gui._baue_persistenzdaten()
+
+    assert serialisiert == ["srv-01", "srv-02", "srv-02"]
+    assert [eintrag["status"] for eintrag in daten.serverlisten] == ["neu", "analysiert"]
+    assert daten.rollen == {"srv-01": ["APP"], "srv-02": ["SQL", "APP"]}
+
+
+def test_analyse_memo_wird_bei_abweichenden_zielen_freigegeben() -> None:
+    """Ein Memo für andere Ziele soll verworfen werden, statt bis zum Ablauf Speicher zu belegen."""
+    import time
+
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    ergebnisse = [AnalyseErgebnis(server="srv-01", zeitpunkt=datetime.now())]
+    gui._analyse_memo = {(("srv-01",),): (time.monotonic(), ergebnisse)}
+    gui.modulzustand = {}
+
+    assert gui._lese_analyse_memo((("srv-01",),)) is ergebnisse
+    assert gui._lese_analyse_memo((("srv-02",),)) is None
+    assert gui._analyse_memo == {}
+
+
+def test_analyse_starten_nutzt_memo_und_kennzeichnet_bericht_als_cache(monkeypatch, tmp_path) -> None:
+    """Ein wiederholter Lauf soll gemerkte Ergebnisse mit Cache-Hinweis berichten; nach dem Leeren wird neu analysiert."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    analysiert_in: list[str | None] = []
+
+    def _fake_analyse(ziele, lauf_id=None) -> list[AnalyseErgebnis]:
+        analysiert_in.append(lauf_id)
+        return [AnalyseErgebnis(server=ziele[0].name, zeitpunkt=datetime(2026, 1, 2, 3, 4, 5), lauf_id=lauf_id)]
+
+    bericht = tmp_path / "serverbericht.md"
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._zeilen_nach_id = {"row-1": ServerTabellenZeile(servername="srv-01", app=True)}
+    gui._id_nach_norm_name = {"srv-01": "row-1"}
+    gui.tree = _FakeTree()
+    gui._ausgabe_pfad = _FakeVar(str(bericht))
+    gui._report_verweis_var = _FakeVar()
+    gui.shell = _FakeShell()
+    gui.master = _SynchronerMaster()
+    gui._analyse_memo = {}
+    gui.modulzustand = {}
+    gui.speichern = lambda **_kwargs: None
+    gui._setze_laufstatus = lambda *_args, **_kwargs: None
+    gui._zeige_ergebnisse_aufklappbar = lambda _ergebnisse: None
+
+    lauf_ids = iter(["lauf-001", "lauf-002", "lauf-003"])
+    monkeypatch.setattr("server_analysis_gui.erstelle_lauf_id", lambda: next(lauf_ids))
+    monkeypatch.setattr("server_analysis_gui.setze_lauf_id", lambda _lauf_id: None)
+    monkeypatch.setattr("server_analysis_gui.analysiere_mehrere_server", _fake_analyse)
+
+    gui.analyse_starten()
+    assert "- Quelle:" not in bericht.read_text(encoding="utf-8")
+
+    gui.analyse_starten()
+    text = bericht.read_text(encoding="utf-8")
+    assert analysiert_in == ["lauf-001"]
+    assert [ergebnis.lauf_id for ergebnis in gui._letzte_ergebnisse] == ["lauf-002"]
+    assert "- Lauf-ID: lauf-002" in text
+    assert "- Quelle: Cache (Stand 2026-01-02T03:04:05)" in text
+    assert "Quelle: Cache (Stand 2026-01-02T03:04:05)" in gui.shell.logs[-1]
+
+    gui.analyse_cache_leeren()
+    gui.analyse_starten()
+    assert analysiert_in == ["lauf-001", "lauf-003"]
+    assert "- Quelle:" not in bericht.read_text(encoding="utf-8")
+
+
+def test_discovery_uebernahme_fuegt_auswahl_gesammelt_ein(monkeypatch) -> None:
+    """Ausgewählte Discovery-Treffer sollen gesammelt mit einem einzigen Einfügeaufruf übernommen werden."""
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    auswahl = [
+        DiscoveryTabellenTreffer(hostname="srv-sql-01", ip_adresse="10.0.0.1", erreichbar=True, dienste="1433", vertrauensgrad=0.9, erkannte_dienste=("1433",)),
+        DiscoveryTabellenTreffer(hostname="srv-alt", ip_adresse="10.0.0.2", erreichbar=True, dienste="-", vertrauensgrad=0.5),
+    ]
+
+    class _FakeDialog:
+        def __init__(self, _parent, _treffer) -> None:
+            self.window = None
+            self.ausgewaehlt = auswahl
+
+    monkeypatch.setattr(server_analysis_gui, "DiscoveryTrefferDialog", _FakeDialog)
+
+    stapel: list[list[str]] = []
+    meldungen: list[str] = []
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.master = type("Master", (), {"wait_window": staticmethod(lambda _fenster: None)})()
+    gui.shell = type("Shell", (), {"zeige_erfolg": staticmethod(lambda _titel, text, _hinweis: meldungen.append(text))})()
+    gui._fuege_zeilen_ein = lambda zeilen: stapel.append([zeile.servername for zeile in zeilen]) or 1
+
+    gui._uebernehme_discovery_treffer([], erfolgstitel="Fertig")
+
+    assert stapel == [["srv-sql-01", "srv-alt"]]
+    assert meldungen[0].endswith("Neu übernommen: 1")
+
+
+def test_toggle_rolle_ermittelt_klickzeile_mit_einem_tcl_aufruf() -> None:
+    """Ein Klick in eine Rollenspalte soll Region und Zeile mit einem Tcl-Aufruf ermitteln und die Rolle umschalten."""
+    from types import SimpleNamespace
+
+    import server_analysis_gui
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    spalte_id, (spaltenname, attribut) = next(iter(server_analysis_gui._SPALTEN_KLICK_ATTR.items()))
+    zeile = ServerTabellenZeile(servername="srv-01")
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui.tree = _FakeTree()
+    gui.tree.klick_spalte = spalte_id
+    gui.tree.klick_zeile = "I001"
+    gui._zeilen_nach_id = {"I001": zeile}
+
+    gui._toggle_rolle_per_klick(SimpleNamespace(x=10, y=40))
+
+    assert len(gui.tree.tk.aufrufe) == 1 and gui.tree.tk.aufrufe[0][1] == server_analysis_gui._TCL_KLICK_ZEILE
+    assert getattr(zeile, attribut) is True
+    assert gui.tree.gesetzt == [("I001", spaltenname, server_analysis_gui._CHECK_AN)]
+
+    # Klicks außerhalb einer Zelle (z. B. auf die Überschrift) lassen die Zeile unverändert.
+    gui.tree.klick_zeile = ""
+    gui._toggle_rolle_per_klick(SimpleNamespace(x=10, y=5))
+
+    assert getattr(zeile, attribut) is True
+    assert len(gui.tree.gesetzt) == 1
+
+
+def test_setze_textfeld_inhalt_ersetzt_inhalt_mit_einem_aufruf() -> None:
+    """Tab-Textfelder sollen ihren Inhalt mit einem einzigen Ersetzen-Aufruf schreibgeschützt aktualisieren."""
+    from server_analysis_gui import MehrserverAnalyseGUI
+
+    aufrufe: list[tuple[object, ...]] = []
+
+    class _FakeText:
+        def configure(self, **kwargs: str) -> None:
+            aufrufe.append(("configure", kwargs["state"]))
+
+        def replace(self, start: str, ende: str, text: str) -> None:
+            aufrufe.append(("replace", start, ende, text))
+
+    gui = MehrserverAnalyseGUI.__new__(MehrserverAnalyseGUI)
+    gui._setze_textfeld_inhalt(_FakeText(), ["Zeile 1", "Zeile 2"])
+
+    assert aufrufe == [
+        ("configure", "normal"),
+        ("replace", "1.0", "end", "Zeile 1\nZeile 2"),
+        ("configure", "disabled"),
+    ]
@@ -30,6 +30,24 @@ class TestServerRolesAnalysisLegacy(unittest.TestCase):
         with patch("server_roles_analysis._protokolliere_und_warne_deprecation"):
             self.assertEqual(1, server_roles_analysis.main([]))
 
+    def test_logging_wird_erst_bei_erster_nutzung_einmalig_eingerichtet(self) -> None:
+        """Der Import richtet kein Datei-Logging ein; wiederholte Aufrufe protokollieren nicht erneut."""
+        server_roles_analysis._konfiguriere_logging.cache_clear()
+        server_roles_analysis._protokolliere_legacy_hinweis.cache_clear()
+        with (
+            patch("server_roles_analysis.logging.basicConfig") as basic_config_mock,
+            patch("server_roles_analysis.logging.warning") as warning_mock,
+            patch("server_roles_analysis.warnings.warn") as warn_mock,
+        ):
+            server_roles_analysis._protokolliere_und_warne_deprecation()
+            server_roles_analysis._protokolliere_und_warne_deprecation()
+
+        basic_config_mock.assert_called_once()
+        warning_mock.assert_called_once()
+        self.assertEqual(2, warn_mock.call_count)
+        server_roles_analysis._konfiguriere_logging.cache_clear()
+        server_roles_analysis._protokolliere_legacy_hinweis.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()